@@ -0,0 +1,52 @@
+"""
+Backend Pusher - Sends tracking payloads to the Dixi backend off the tracking thread
+A slow or unreachable backend drops stale pushes instead of stalling frame processing
+"""
+
+import json
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+class BackendPusher:
+    """Posts JSON payloads to the backend from a background worker thread."""
+
+    def __init__(self, backend_url: str, timeout: float = 0.5):
+        self.backend_url = backend_url
+        self.timeout = timeout
+        # Newest unsent payload per path - a push replaces whatever is still waiting for that path
+        self.pending: Dict[str, Dict] = {}
+        self.pending_ready = threading.Condition()
+        # One session keeps the connection to the backend alive between pushes. A single
+        # worker talks to a single host, so one pooled connection is all it ever needs.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def push(self, path: str, payload: Dict):
+        """Queue a payload for POSTing to backend_url + path, superseding any unsent one for that path."""
+        with self.pending_ready:
+            self.pending[path] = payload
+            self.pending_ready.notify()
+
+    def _run(self):
+        while True:
+            with self.pending_ready:
+                self.pending_ready.wait_for(lambda: self.pending)
+                path = next(iter(self.pending))  # Oldest waiting path first, so no endpoint starves
+                payload = self.pending.pop(path)
+            try:
+                # Compact separators keep the body small; payloads are plain dicts of floats/bools/strings
+                body = json.dumps(payload, separators=(',', ':'))
+                self.session.post(f"{self.backend_url}{path}", data=body, headers=JSON_HEADERS, timeout=self.timeout)
+            except requests.exceptions.RequestException:
+                pass  # Silently fail - backend might be down
@@ -0,0 +1,156 @@
+"""
+Camera Stream - Background capture thread for the vision service
+Keeps only the newest camera frame so slow inference never works on stale, buffered frames
+"""
+
+import cv2
+import logging
+import numpy as np
+import os
+import sys
+import threading
+import time
+from typing import Optional, Tuple
+
+
+logger = logging.getLogger('vision')
+
+
+def camera_settings_from_env() -> dict:
+    """CameraStream keyword arguments from CAMERA_INDEX, CAMERA_WIDTH, CAMERA_HEIGHT and CAMERA_CODEC."""
+    return {
+        'camera_index': int(os.getenv('CAMERA_INDEX', '0')),
+        'width': int(os.getenv('CAMERA_WIDTH', '0')),
+        'height': int(os.getenv('CAMERA_HEIGHT', '0')),
+        'codec': os.getenv('CAMERA_CODEC', 'MJPG'),
+    }
+
+
+class CameraStream(threading.Thread):
+    """Producer thread that continuously reads camera frames into a single latest-frame slot."""
+
+    def __init__(self, camera_index: int, width: int = 0, height: int = 0, codec: str = 'MJPG', max_fps: float = 30):
+        super().__init__(daemon=True)
+        self.camera_index = camera_index
+        self.width = width  # 0 keeps the camera's native resolution
+        self.height = height
+        self.codec = codec  # FOURCC to request; empty keeps the driver default
+        self.max_fps = max_fps
+        # Frames arriving faster than this are grabbed but never decoded. 25% slack keeps a camera
+        # that delivers exactly max_fps from losing frames to timing jitter.
+        self.min_decode_interval = 0.75 / max_fps
+        self.capture = None
+        self.is_running = False
+        self.frame_id = 0
+        self._frame = None
+        self._cond = threading.Condition()
+
+    def open(self) -> bool:
+        """Open the camera device. Returns False if it could not be opened."""
+        # Use V4L2 directly on Linux so the format request below is honored;
+        # fall back to OpenCV's default backend if V4L2 cannot open the device
+        self.capture = None
+        if sys.platform.startswith('linux'):
+            self.capture = cv2.VideoCapture(self.camera_index, cv2.CAP_V4L2)
+            if not self.capture.isOpened():
+                self.capture.release()
+                self.capture = None
+        if self.capture is None:
+            self.capture = cv2.VideoCapture(self.camera_index)
+
+        if not self.capture.isOpened():
+            self.capture.release()
+            self.capture = None
+            return False
+
+        # Ask for compressed MJPG frames - less USB bandwidth than raw YUYV and a cheaper
+        # decode path, so the camera can hold 30fps at higher resolutions. V4L2 drivers
+        # expect the FOURCC before the resolution, and the resolution before the frame rate.
+        if self.codec:
+            self.capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.codec))
+        if self.width and self.height:
+            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.capture.set(cv2.CAP_PROP_FPS, self.max_fps)
+
+        # Get camera resolution
+        width = int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        logger.info(f"Camera opened: {width}x{height}")
+
+        # Reduce buffer for lower latency
+        self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        self.is_running = True
+        return True
+
+    def run(self):
+        """Capture loop - drains every frame the camera delivers, decoding at most max_fps of them."""
+        last_decode = 0.0
+        try:
+            while self.is_running:
+                # grab() only advances the driver buffer; the expensive decode happens in retrieve()
+                if not self.capture.grab():
+                    time.sleep(0.05)
+                    continue
+
+                now = time.monotonic()
+                if now - last_decode < self.min_decode_interval:
+                    continue
+
+                ret, frame = self.capture.retrieve()
+                if not ret:
+                    continue
+                last_decode = now
+
+                with self._cond:
+                    self._frame = frame
+                    self.frame_id += 1
+                    self._cond.notify_all()
+        except Exception as e:
+            logger.error(f"Error in camera capture loop: {e}")
+        finally:
+            self.is_running = False
+            with self._cond:
+                self._cond.notify_all()
+            self.capture.release()
+
+    def read(self, last_id: int = 0, timeout: float = 1.0) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        Wait for a frame newer than last_id and return (frame_id, frame).
+
+        frame_id equals last_id if nothing new arrived before the timeout. Each frame is a
+        fresh array that the capture thread never touches again, so callers may draw on it.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self.frame_id != last_id or not self.is_running, timeout)
+            return self.frame_id, self._frame
+
+    def frames(self):
+        """
+        Yield (frame, timestamp_ms, captured_at_ms, skipped) for every new frame until capture stops.
+
+        timestamp_ms comes from the monotonic clock and is strictly increasing, as MediaPipe's VIDEO
+        mode requires; use it for inference and motion timing. captured_at_ms is wall-clock time
+        for stamping payloads. skipped counts frames that were replaced before the caller came
+        back for the next one.
+        """
+        frame_id = 0
+        timestamp_ms = 0
+        while self.is_running:
+            new_frame_id, frame = self.read(frame_id)
+            if new_frame_id == frame_id:
+                continue  # Timed out, or capture stopped
+            skipped = new_frame_id - frame_id - 1 if frame_id else 0
+            frame_id = new_frame_id
+            timestamp_ms = max(time.monotonic_ns() // 1_000_000, timestamp_ms + 1)
+            yield frame, timestamp_ms, int(time.time() * 1000), skipped
+
+    def release(self):
+        """Stop capturing and release the camera."""
+        self.is_running = False
+
+        if self.is_alive():
+            self.join(timeout=1)
+        elif self.capture:
+            self.capture.release()
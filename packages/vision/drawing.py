@@ -0,0 +1,16 @@
+"""
+Drawing - Batched OpenCV overlay helpers for the vision service
+Overlays are drawn with as few OpenCV calls as possible, since each call has a fixed overhead
+"""
+
+import cv2
+import numpy as np
+
+
+def draw_dots(frame, pixels: np.ndarray, radius: int, color):
+    """Draw a filled dot at every (x, y) in the (N, 2) int32 pixel array with a single OpenCV call."""
+    if len(pixels) == 0:
+        return
+    # A zero-length segment drawn 2*radius thick is rasterized exactly like cv2.circle(..., radius, color, -1)
+    segments = np.repeat(pixels[:, np.newaxis, :], 2, axis=1)
+    cv2.polylines(frame, list(segments), False, color, 2 * radius)
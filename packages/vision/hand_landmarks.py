@@ -0,0 +1,91 @@
+"""
+Hand Landmarks - MediaPipe hand landmark indices and finger-state helpers shared by the tracking services
+Landmarks are read once into a (21, 3) array and every test runs on that array
+"""
+
+import numpy as np
+from typing import Optional
+
+
+# Landmark indices read individually; the rest are only used through the arrays below
+WRIST, THUMB_MCP, THUMB_IP, THUMB_TIP, INDEX_TIP = 0, 2, 3, 4, 8
+# Extended-finger bitmask, thumb in the high bit: thumb<<4 | index<<3 | middle<<2 | ring<<1 | pinky
+THUMB, INDEX, MIDDLE, RING, PINKY = 0b10000, 0b01000, 0b00100, 0b00010, 0b00001
+FINGER_BITS = (('thumb', THUMB), ('index', INDEX), ('middle', MIDDLE), ('ring', RING), ('pinky', PINKY))
+# Index..pinky tip and PIP joint landmarks, with each finger's bit for the vectorized extended test
+FINGER_TIPS = np.array([8, 12, 16, 20], dtype=np.int32)
+FINGER_PIPS = np.array([6, 10, 14, 18], dtype=np.int32)
+FINGER_TIP_BITS = np.array([INDEX, MIDDLE, RING, PINKY], dtype=np.int32)
+
+
+def landmarks_to_array(landmarks, points: np.ndarray) -> np.ndarray:
+    """Copy 21 MediaPipe hand landmarks into the (21, 3) points buffer, reading each one only once."""
+    for i, landmark in enumerate(landmarks):
+        points[i] = (landmark.x, landmark.y, landmark.z)
+    return points
+
+
+def get_finger_bits(points: np.ndarray) -> int:
+    """Detect which fingers are extended, as a THUMB..PINKY bitmask."""
+    # Thumb - tip further from the MCP joint than the IP joint is
+    thumb_x, ip_x, mcp_x = points[THUMB_TIP, 0], points[THUMB_IP, 0], points[THUMB_MCP, 0]
+    bits = THUMB if abs(thumb_x - mcp_x) > abs(ip_x - mcp_x) * 0.5 else 0
+
+    # Other fingers - tip above PIP joint means extended, compared for all four at once
+    extended = points[FINGER_TIPS, 1] < points[FINGER_PIPS, 1]
+    return bits | int(FINGER_TIP_BITS[extended].sum())
+
+
+class SwipeHistory:
+    """Ring buffer of one hand's recent wrist positions, with swipe detection over it."""
+
+    def __init__(self, size: int = 15):
+        # One array per field (x, y, time_ms), overwritten in place once full
+        self.x = np.zeros(size, dtype=np.float32)
+        self.y = np.zeros(size, dtype=np.float32)
+        self.t = np.zeros(size, dtype=np.int64)
+        self.head = 0  # Next slot to write
+        self.length = 0
+
+    def record(self, x: float, y: float, timestamp_ms: int):
+        """Append a wrist position, overwriting the oldest when full."""
+        size = len(self.t)
+        self.x[self.head] = x
+        self.y[self.head] = y
+        self.t[self.head] = timestamp_ms
+        self.head = (self.head + 1) % size
+        self.length = min(self.length + 1, size)
+
+    def clear(self):
+        """Forget all positions, e.g. when the hand leaves the frame."""
+        self.length = 0
+
+    def detect_swipe(self) -> Optional[str]:
+        """'swipe_left' or 'swipe_right' if the recorded motion is a fast horizontal swipe, else None."""
+        if self.length < 8:
+            return None
+
+        # Only the oldest and newest positions matter
+        size = len(self.t)
+        start = (self.head - self.length) % size
+        end = (self.head - 1) % size
+
+        dx = float(self.x[end] - self.x[start])
+        dy = float(self.y[end] - self.y[start])
+        dt = int(self.t[end] - self.t[start]) / 1000.0  # seconds
+
+        if dt < 0.1:  # Too fast, likely noise
+            return None
+
+        # Need significant movement and velocity (>= 0.3/s, compared squared to skip the sqrt)
+        if dx * dx + dy * dy < (0.3 * dt) ** 2:
+            return None
+
+        # Horizontal swipe
+        if abs(dx) > abs(dy) * 1.5:
+            if dx > 0.1:
+                return 'swipe_right'
+            elif dx < -0.1:
+                return 'swipe_left'
+
+        return None
@@ -0,0 +1,57 @@
+"""
+Landmarkers - Creates MediaPipe landmarkers on the configured inference delegate, and their input images
+VISION_DELEGATE=gpu tries the GPU delegate first and falls back to CPU if it cannot be created
+"""
+
+import cv2
+import logging
+import mediapipe as mp
+import numpy as np
+import os
+from mediapipe.tasks import python
+
+
+logger = logging.getLogger('vision')
+
+
+def create_landmarker(landmarker_cls, options_cls, model_path: str, **options):
+    """Create a landmarker from a .task model, using the GPU delegate when requested and available."""
+    if os.getenv('VISION_DELEGATE', 'cpu').lower() == 'gpu':
+        try:
+            base_options = python.BaseOptions(model_asset_path=model_path, delegate=python.BaseOptions.Delegate.GPU)
+            return landmarker_cls.create_from_options(options_cls(base_options=base_options, **options))
+        except Exception as e:
+            # No usable GPU / GL context (e.g. headless or Windows) - the CPU delegate always works
+            logger.warning(f"GPU delegate unavailable for {os.path.basename(model_path)}, using CPU: {e}")
+
+    base_options = python.BaseOptions(model_asset_path=model_path)
+    return landmarker_cls.create_from_options(options_cls(base_options=base_options, **options))
+
+
+class InferenceImageConverter:
+    """Turns BGR camera frames into the RGB mp.Image fed to the landmarkers, reusing its buffers between frames."""
+
+    def __init__(self):
+        # Frames wider than this are downscaled before inference (0 = always use full resolution)
+        self.max_width = int(os.getenv('INFERENCE_MAX_WIDTH', '640'))
+        self.resize_buffer = None
+        self.rgb_buffer = None
+
+    def convert(self, frame) -> mp.Image:
+        """
+        Downscale (if needed) and convert a frame. The returned image wraps a buffer that the
+        next call overwrites, so each frame must be fully processed before the next is converted.
+        """
+        h, w, _ = frame.shape
+
+        # Landmarks come back normalized to [0, 1], so drawing on the full-size frame is unaffected
+        if 0 < self.max_width < w:
+            size = (self.max_width, round(h * self.max_width / w))
+            if self.resize_buffer is None or self.resize_buffer.shape[1::-1] != size:
+                self.resize_buffer = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            frame = cv2.resize(frame, size, dst=self.resize_buffer, interpolation=cv2.INTER_AREA)
+
+        if self.rgb_buffer is None or self.rgb_buffer.shape != frame.shape:
+            self.rgb_buffer = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.rgb_buffer)
+        return mp.Image(image_format=mp.ImageFormat.SRGB, data=self.rgb_buffer)
@@ -7,73 +7,123 @@ Uses MediaPipe Tasks API for efficient multi-model inference
 from flask import Flask, jsonify, request, Response, render_template
 from flask_cors import CORS
 import cv2
-import mediapipe as mp
-from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
 import numpy as np
 import threading
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import os
 import sys
-import io
+import math
+import json
 import collections
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-import requests
 from unified_tracking import UnifiedTrackingService
+from camera_stream import CameraStream, camera_settings_from_env
+from backend_pusher import BackendPusher
+from landmarkers import create_landmarker, InferenceImageConverter
+from drawing import draw_dots
+from hand_landmarks import (
+    WRIST, THUMB_TIP, INDEX_TIP, THUMB, INDEX, MIDDLE, RING, PINKY, FINGER_BITS,
+    SwipeHistory, landmarks_to_array, get_finger_bits
+)
 
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)
 
-# Log buffer for debug UI
+# Gestures reported by /status (static, so built once at import)
+SUPPORTED_GESTURES = ('pinch', 'point', 'open_palm', 'fist', 'swipe_left', 'swipe_right',
+                      'peace', 'thumbs_up', 'thumbs_down', 'ok')
+
+# Hand skeleton as landmark index strips, each drawn as one open polyline
+HAND_STRIPS = (
+    np.array([0, 1, 2, 3, 4], dtype=np.int32),  # Thumb
+    np.array([0, 5, 6, 7, 8], dtype=np.int32),  # Index
+    np.array([5, 9, 10, 11, 12], dtype=np.int32),  # Middle
+    np.array([9, 13, 14, 15, 16], dtype=np.int32),  # Ring
+    np.array([13, 17, 18, 19, 20], dtype=np.int32),  # Pinky
+    np.array([0, 17], dtype=np.int32),  # Palm base
+)
+
+def _static_gesture(fingers: int):
+    """(type, confidence) for a hand pose decided by the finger bitmask alone."""
+    if fingers == 0:
+        return 'fist', 0.9  # All fingers closed
+    if fingers == THUMB | INDEX | MIDDLE | RING | PINKY:
+        return 'open_palm', 0.9  # All fingers extended
+    if (fingers & (INDEX | MIDDLE | RING | PINKY)) == INDEX | MIDDLE:
+        return 'peace', 0.85  # Index and middle extended
+    if (fingers & (INDEX | MIDDLE | RING | PINKY)) == INDEX:
+        return 'point', 0.85  # Only index extended
+    return 'unknown', 0.7
+
+
+# Static gestures for every finger bitmask, so the per-frame decision is a single index.
+# Thumb-only (thumbs up/down) also depends on thumb direction and is handled separately.
+STATIC_GESTURES = tuple(_static_gesture(fingers) for fingers in range(32))
+
+# Face mesh indices used for overlays (the face model always returns 468+ landmarks)
+FACE_KEY_POINTS = np.array([33, 263, 4, 13], dtype=np.int32)  # Left eye, right eye, nose, mouth
+FACE_OUTLINE = np.array([10, 151, 9, 175, 18, 200, 199, 175, 10], dtype=np.int32)
+# Face mesh indices read by detect_face, in the order they are unpacked there
+FACE_FEATURE_POINTS = np.array([33, 263, 4, 13, 61, 291], dtype=np.int32)
+# Left eye, right eye and mouth openings: top/bottom landmark pairs and the height that counts as open
+FACE_OPENING_TOPS = np.array([159, 386, 13], dtype=np.int32)
+FACE_OPENING_BOTTOMS = np.array([145, 374, 14], dtype=np.int32)
+FACE_OPENING_THRESHOLDS = np.array([0.01, 0.01, 0.015], dtype=np.float32)
+
+# Multipart framing around each JPEG in /video_feed
+MJPEG_PART_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+MJPEG_PART_TRAILER = b'\r\n\r\n'
+
+# Log buffer for debug UI - (time, level, message) tuples, formatted only when /logs is read
 log_buffer = collections.deque(maxlen=100)
 
-class LogCapture(io.StringIO):
-    def write(self, s):
-        if s.strip():
-            log_buffer.append(f"[{time.strftime('%H:%M:%S')}] {s.strip()}")
-        return super().write(s)
 
-# Redirect stdout to capture logs
-sys.stdout = LogCapture()
+class RingHandler(logging.Handler):
+    """Logging handler that keeps raw records in log_buffer - no formatting on the logging thread."""
+
+    def emit(self, record):
+        log_buffer.append((record.created, record.levelno, record.getMessage()))
+
+
+# Every vision module logs to this logger: lines go to the console and into log_buffer for /logs
+logger = logging.getLogger('vision')
+logger.setLevel(logging.INFO)
+logger.addHandler(RingHandler())
+console_handler = logging.StreamHandler(sys.stdout)
+console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+logger.addHandler(console_handler)
 
 
 class FaceDetectionService:
     """Face detection using MediaPipe FaceLandmarker."""
     
     def __init__(self):
-        model_path = os.path.join(os.path.dirname(__file__), 'face_landmarker.task')
+        self.model_path = os.path.join(os.path.dirname(__file__), 'face_landmarker.task')
+        # The model is loaded on first enable(), so a service that only runs unified
+        # tracking never holds a second FaceLandmarker in memory
+        self.landmarker = None
+        self.load_lock = threading.Lock()
+        self.available = os.path.exists(self.model_path)
         
-        if not os.path.exists(model_path):
-            print(f"WARNING: Face model file not found at {model_path}")
-            print(f"Download from: https://storage.googleapis.com/mediapipe-models/face_landmarker/face_landmarker/float16/1/face_landmarker.task")
-            self.landmarker = None
-        else:
-            try:
-                base_options = python.BaseOptions(model_asset_path=model_path)
-                options = vision.FaceLandmarkerOptions(
-                    base_options=base_options,
-                    output_face_blendshapes=True,
-                    output_facial_transformation_matrixes=True,
-                    num_faces=1,  # Single face for simplicity
-                    min_face_detection_confidence=0.5,
-                    min_face_presence_confidence=0.5,
-                    min_tracking_confidence=0.5,
-                    running_mode=vision.RunningMode.VIDEO
-                )
-                self.landmarker = vision.FaceLandmarker.create_from_options(options)
-                print("Face Detection Service initialized")
-            except Exception as e:
-                print(f"ERROR: Failed to initialize face landmarker: {e}")
-                self.landmarker = None
+        if not self.available:
+            logger.warning(f"Face model file not found at {self.model_path}")
+            logger.warning(f"Download from: https://storage.googleapis.com/mediapipe-models/face_landmarker/face_landmarker/float16/1/face_landmarker.task")
         
         self.current_face_data = None
+        self.current_face_points = None
+        self.current_face_json = None  # (face_data, JSON bytes) for the last face_data served
         self.enabled = False
+        # Blendshape names come in a fixed model order, so they are read once and reused
+        self.blendshape_names = None
     
-    def detect_face(self, mp_image, timestamp_ms: int):
-        """Detect face in frame. Returns (face_data, face_landmarks)."""
+    def detect_face(self, mp_image, timestamp_ms: int, captured_at_ms: int):
+        """Detect face in frame. Returns (face_data, face_points) where face_points is an (N, 2) array."""
         if not self.landmarker or not self.enabled:
             return None, None
         
@@ -83,66 +133,53 @@ class FaceDetectionService:
             if result.face_landmarks and len(result.face_landmarks) > 0:
                 face_landmarks = result.face_landmarks[0]
                 
-                # Calculate face bounding box
-                xs = [landmark.x for landmark in face_landmarks]
-                ys = [landmark.y for landmark in face_landmarks]
+                # Normalized (x, y) of every landmark, gathered in one pass
+                face_points = np.array([(landmark.x, landmark.y) for landmark in face_landmarks], dtype=np.float32)
                 
-                # Get key facial points
-                left_eye = face_landmarks[33]  # Left eye outer corner
-                right_eye = face_landmarks[263]  # Right eye outer corner
-                nose_tip = face_landmarks[4]  # Nose tip
-                mouth_center = face_landmarks[13]  # Mouth center
+                # Calculate face bounding box
+                x_min, y_min = face_points.min(axis=0).tolist()
+                x_max, y_max = face_points.max(axis=0).tolist()
                 
-                # Eye landmarks for gaze and open/closed detection
-                left_eye_top = face_landmarks[159]  # Left eye top
-                left_eye_bottom = face_landmarks[145]  # Left eye bottom
-                right_eye_top = face_landmarks[386]  # Right eye top
-                right_eye_bottom = face_landmarks[374]  # Right eye bottom
+                # Key facial points, gathered from the landmark array in one indexing op
+                (
+                    (left_eye_x, left_eye_y),  # Left eye outer corner
+                    (right_eye_x, right_eye_y),  # Right eye outer corner
+                    (nose_x, nose_y),  # Nose tip
+                    (mouth_center_x, mouth_center_y),  # Mouth center (upper lip)
+                    (mouth_left_x, mouth_left_y), (mouth_right_x, mouth_right_y),  # Mouth corners
+                ) = face_points[FACE_FEATURE_POINTS].tolist()
                 
-                # Mouth landmarks for open/closed and smile detection
-                mouth_left = face_landmarks[61]  # Mouth left corner
-                mouth_right = face_landmarks[291]  # Mouth right corner
-                mouth_top = face_landmarks[13]  # Upper lip
-                mouth_bottom = face_landmarks[14]  # Lower lip
+                # Eye and mouth open/closed detection - all three openings measured and thresholded at once
+                opening_heights = np.abs(face_points[FACE_OPENING_TOPS, 1] - face_points[FACE_OPENING_BOTTOMS, 1])
+                left_eye_open, right_eye_open, mouth_open = (opening_heights > FACE_OPENING_THRESHOLDS).tolist()
+                left_eye_height, right_eye_height, mouth_height = opening_heights.tolist()
                 
                 # Calculate head pose (simple estimation)
-                eye_center_x = (left_eye.x + right_eye.x) / 2
-                eye_center_y = (left_eye.y + right_eye.y) / 2
-                nose_x = nose_tip.x
-                nose_y = nose_tip.y
+                eye_center_x = (left_eye_x + right_eye_x) / 2
                 
                 # Simple head pose estimation
-                head_tilt = np.arctan2(right_eye.y - left_eye.y, right_eye.x - left_eye.x) * 180 / np.pi
+                head_tilt = math.degrees(math.atan2(right_eye_y - left_eye_y, right_eye_x - left_eye_x))
                 head_turn = (nose_x - eye_center_x) * 30  # Rough estimate
                 
-                # Eye open/closed detection
-                left_eye_height = abs(left_eye_top.y - left_eye_bottom.y)
-                right_eye_height = abs(right_eye_top.y - right_eye_bottom.y)
-                left_eye_open = left_eye_height > 0.01  # Threshold for open
-                right_eye_open = right_eye_height > 0.01
-                
                 # Eye gaze direction (simplified - based on eye position relative to face center)
-                face_center_x = (min(xs) + max(xs)) / 2
-                left_eye_gaze_x = (left_eye.x - face_center_x) * 2  # Normalize to -1 to 1
-                right_eye_gaze_x = (right_eye.x - face_center_x) * 2
+                face_center_x = (x_min + x_max) / 2
+                left_eye_gaze_x = (left_eye_x - face_center_x) * 2  # Normalize to -1 to 1
+                right_eye_gaze_x = (right_eye_x - face_center_x) * 2
                 eye_gaze_direction = (left_eye_gaze_x + right_eye_gaze_x) / 2
                 
-                # Mouth open/closed detection
-                mouth_height = abs(mouth_top.y - mouth_bottom.y)
-                mouth_width = abs(mouth_right.x - mouth_left.x)
-                mouth_open = mouth_height > 0.015  # Threshold for open mouth
-                mouth_open_ratio = mouth_height / mouth_width if mouth_width > 0 else 0
+                # Mouth shape
+                mouth_width = abs(mouth_right_x - mouth_left_x)
+                mouth_open_ratio = mouth_height / mouth_width if mouth_width > 0 else 0.0
                 
                 # Smile detection (mouth corners raised)
-                mouth_corner_avg_y = (mouth_left.y + mouth_right.y) / 2
-                mouth_center_y = mouth_center.y
-                smile_score = max(0, (mouth_center_y - mouth_corner_avg_y) * 10)  # Positive when corners are higher
+                mouth_corner_avg_y = (mouth_left_y + mouth_right_y) / 2
+                smile_score = max(0.0, (mouth_center_y - mouth_corner_avg_y) * 10)  # Positive when corners are higher
                 is_smiling = smile_score > 0.1
                 
                 # Attention/engagement score (based on head pose and eye state)
                 # Lower tilt and turn = more engaged, eyes open = more engaged
                 head_straightness = 1 - (abs(head_tilt) / 45) - (abs(head_turn) / 30)
-                head_straightness = max(0, min(1, head_straightness))
+                head_straightness = max(0.0, min(1.0, head_straightness))
                 eye_engagement = 1.0 if (left_eye_open and right_eye_open) else 0.5
                 engagement_score = (head_straightness * 0.6 + eye_engagement * 0.4)
                 
@@ -150,102 +187,130 @@ class FaceDetectionService:
                     'detected': True,
                     'landmarks_count': len(face_landmarks),
                     'bounding_box': {
-                        'x_min': float(min(xs)),
-                        'y_min': float(min(ys)),
-                        'x_max': float(max(xs)),
-                        'y_max': float(max(ys)),
-                        'width': float(max(xs) - min(xs)),
-                        'height': float(max(ys) - min(ys))
+                        'x_min': x_min,
+                        'y_min': y_min,
+                        'x_max': x_max,
+                        'y_max': y_max,
+                        'width': x_max - x_min,
+                        'height': y_max - y_min
                     },
                     'key_points': {
-                        'left_eye': {'x': float(left_eye.x), 'y': float(left_eye.y)},
-                        'right_eye': {'x': float(right_eye.x), 'y': float(right_eye.y)},
-                        'nose_tip': {'x': float(nose_tip.x), 'y': float(nose_tip.y)},
-                        'mouth_center': {'x': float(mouth_center.x), 'y': float(mouth_center.y)}
+                        'left_eye': {'x': left_eye_x, 'y': left_eye_y},
+                        'right_eye': {'x': right_eye_x, 'y': right_eye_y},
+                        'nose_tip': {'x': nose_x, 'y': nose_y},
+                        'mouth_center': {'x': mouth_center_x, 'y': mouth_center_y}
                     },
                     'head_pose': {
-                        'tilt': float(head_tilt),
-                        'turn': float(head_turn)
+                        'tilt': head_tilt,
+                        'turn': head_turn
                     },
                     'eye_features': {
-                        'left_eye_open': bool(left_eye_open),
-                        'right_eye_open': bool(right_eye_open),
-                        'both_eyes_open': bool(left_eye_open and right_eye_open),
-                        'gaze_direction': float(eye_gaze_direction),  # -1 (left) to 1 (right)
-                        'left_eye_height': float(left_eye_height),
-                        'right_eye_height': float(right_eye_height)
+                        'left_eye_open': left_eye_open,
+                        'right_eye_open': right_eye_open,
+                        'both_eyes_open': left_eye_open and right_eye_open,
+                        'gaze_direction': eye_gaze_direction,  # -1 (left) to 1 (right)
+                        'left_eye_height': left_eye_height,
+                        'right_eye_height': right_eye_height
                     },
                     'mouth_features': {
-                        'mouth_open': bool(mouth_open),
-                        'mouth_open_ratio': float(mouth_open_ratio),
-                        'smile_score': float(smile_score),
-                        'is_smiling': bool(is_smiling),
-                        'mouth_width': float(mouth_width)
+                        'mouth_open': mouth_open,
+                        'mouth_open_ratio': mouth_open_ratio,
+                        'smile_score': smile_score,
+                        'is_smiling': is_smiling,
+                        'mouth_width': mouth_width
                     },
                     'engagement': {
-                        'score': float(engagement_score),  # 0 to 1
-                        'head_straightness': float(head_straightness),
-                        'eye_engagement': float(eye_engagement),
-                        'is_engaged': bool(engagement_score > 0.6)
+                        'score': engagement_score,  # 0 to 1
+                        'head_straightness': head_straightness,
+                        'eye_engagement': eye_engagement,
+                        'is_engaged': engagement_score > 0.6
                     },
-                    'timestamp': timestamp_ms
+                    'timestamp': captured_at_ms
                 }
                 
                 # Add blendshapes if available
                 if result.face_blendshapes and len(result.face_blendshapes) > 0:
-                    blendshapes = result.face_blendshapes[0]
+                    blendshapes = result.face_blendshapes[0][:10]  # Top 10 expressions
+                    if self.blendshape_names is None:
+                        self.blendshape_names = [shape.category_name for shape in blendshapes]
                     face_data['expressions'] = {
-                        shape.category_name: float(shape.score)
-                        for shape in blendshapes[:10]  # Top 10 expressions
+                        name: float(shape.score)
+                        for name, shape in zip(self.blendshape_names, blendshapes)
                     }
                 
                 self.current_face_data = face_data
-                return face_data, face_landmarks
+                self.current_face_points = face_points
+                return face_data, face_points
             else:
                 self.current_face_data = None
+                self.current_face_points = None
                 return None, None
         except Exception as e:
-            print(f"Face detection error: {e}")
+            logger.error(f"Face detection error: {e}")
             return None, None
     
-    def draw_face_landmarks(self, frame, face_landmarks):
-        """Draw face landmarks on frame."""
-        if not face_landmarks:
+    def draw_face_landmarks(self, frame, face_points):
+        """Draw face landmarks on frame from the (N, 2) normalized points returned by detect_face."""
+        if face_points is None:
             return
         
         h, w, _ = frame.shape
+        scale = np.array([w, h], dtype=np.float32)
         
         # Draw key facial points
-        key_indices = [33, 263, 4, 13]  # Left eye, right eye, nose, mouth
-        for idx in key_indices:
-            if idx < len(face_landmarks):
-                landmark = face_landmarks[idx]
-                cx, cy = int(landmark.x * w), int(landmark.y * h)
-                cv2.circle(frame, (cx, cy), 5, (255, 0, 255), -1)
+        draw_dots(frame, (face_points[FACE_KEY_POINTS] * scale).astype(np.int32), 5, (255, 0, 255))
         
         # Draw face outline (simplified - just key points)
-        outline_indices = [10, 151, 9, 175, 18, 200, 199, 175, 10]  # Face outline
-        points = []
-        for idx in outline_indices:
-            if idx < len(face_landmarks):
-                landmark = face_landmarks[idx]
-                points.append((int(landmark.x * w), int(landmark.y * h)))
-        
-        if len(points) > 2:
-            cv2.polylines(frame, [np.array(points)], False, (0, 255, 255), 2)
+        outline = (face_points[FACE_OUTLINE] * scale).astype(np.int32)
+        cv2.polylines(frame, [outline], False, (0, 255, 255), 2)
     
     def get_current_face(self) -> Optional[Dict]:
         """Get current face detection data."""
         return self.current_face_data
     
+    def get_current_face_json(self) -> Optional[bytes]:
+        """Get current face detection data as JSON, serialized once per detection."""
+        face_data = self.current_face_data
+        if face_data is None:
+            return None
+        
+        # Keyed on the dict itself, so a detection landing mid-request can never be served stale
+        cached = self.current_face_json
+        if cached is None or cached[0] is not face_data:
+            cached = self.current_face_json = (face_data, json.dumps(face_data, separators=(',', ':')).encode())
+        return cached[1]
+    
+    def _load_landmarker(self):
+        """Create the FaceLandmarker if it is not loaded yet. A failed load marks the service unavailable."""
+        with self.load_lock:
+            if self.landmarker or not self.available:
+                return
+            try:
+                self.landmarker = create_landmarker(
+                    vision.FaceLandmarker, vision.FaceLandmarkerOptions, self.model_path,
+                    output_face_blendshapes=True,
+                    output_facial_transformation_matrixes=False,  # Head pose is estimated from landmarks
+                    num_faces=1,  # Single face for simplicity
+                    min_face_detection_confidence=0.5,
+                    min_face_presence_confidence=0.5,
+                    min_tracking_confidence=0.5,
+                    running_mode=vision.RunningMode.VIDEO
+                )
+                logger.info("Face Detection Service initialized")
+            except Exception as e:
+                logger.error(f"Failed to initialize face landmarker: {e}")
+                self.available = False
+    
     def enable(self):
-        """Enable face detection."""
+        """Enable face detection, loading the model on first use."""
+        self._load_landmarker()
         self.enabled = True
     
     def disable(self):
         """Disable face detection."""
         self.enabled = False
         self.current_face_data = None
+        self.current_face_points = None
 
 
 class GestureRecognitionService:
@@ -255,47 +320,80 @@ class GestureRecognitionService:
         model_path = os.path.join(os.path.dirname(__file__), 'hand_landmarker.task')
         
         if not os.path.exists(model_path):
-            print(f"ERROR: Model file not found at {model_path}")
+            logger.error(f"Model file not found at {model_path}")
             self.landmarker = None
         else:
-            base_options = python.BaseOptions(model_asset_path=model_path)
-            options = vision.HandLandmarkerOptions(
-                base_options=base_options,
+            # Runs on the GPU delegate when VISION_DELEGATE=gpu, falling back to CPU
+            self.landmarker = create_landmarker(
+                vision.HandLandmarker, vision.HandLandmarkerOptions, model_path,
                 num_hands=1,  # Single hand only for simplicity
                 min_hand_detection_confidence=0.7,
                 min_hand_presence_confidence=0.5,
                 min_tracking_confidence=0.5,
                 running_mode=vision.RunningMode.VIDEO
             )
-            self.landmarker = vision.HandLandmarker.create_from_options(options)
-            print("Gesture Recognition Service initialized (simplified mode)")
+            logger.info("Gesture Recognition Service initialized (simplified mode)")
         
         self.is_tracking = False
         self.current_gesture = None
         self.camera = None
         self.tracking_thread = None
-        self.latest_frame = None
+        self.latest_frame = None  # Last annotated frame; never drawn on again once published
+        self.latest_jpeg = None  # latest_frame JPEG-encoded once for every viewer (None until needed)
+        self.frame_version = 0
+        self.viewers = 0  # Open /video_feed streams; frames are only encoded eagerly while > 0
         self.camera_error = None
         self.lock = threading.Lock()
+        self.frame_ready = threading.Condition(self.lock)
+        
+        # Recent wrist positions for swipe detection
+        self.swipe_history = SwipeHistory()
         
-        # Simple position history for swipe detection
-        self.position_history = collections.deque(maxlen=15)
+        # Downscales and converts camera frames for the models, reusing its buffers
+        self.inference_images = InferenceImageConverter()
+        
+        # Reused (21, 3) buffer of hand landmark coordinates, refilled once per frame
+        self.hand_points = np.zeros((21, 3), dtype=np.float32)
+        # Last classified (type, confidence, finger bits) and the landmarks it was computed from
+        self.held_pose = None
+        self.held_points = np.zeros((21, 3), dtype=np.float32)
+        # Coarse green-channel sample of the last handless frame the hand model ran on, and the mean
+        # absolute difference (0-255) below which a new frame counts as unchanged - above sensor noise
+        self.static_fingerprint = None
+        self.static_frame_threshold = float(os.getenv('STATIC_FRAME_THRESHOLD', '2.0'))
+        
+        # Camera settings are read once; every start() opens a new stream with them
+        self.camera_settings = camera_settings_from_env()
         
         # Backend push settings
         self.backend_url = os.getenv('BACKEND_URL', 'http://localhost:3001')
+        self.backend = BackendPusher(self.backend_url)
+        # Face geometry changes slowly, so the face model only runs on every Nth frame
+        self.face_detection_stride = max(1, int(os.getenv('FACE_DETECTION_STRIDE', '2')))
+        # Baseline (non-progressive, non-optimized) JPEG keeps the per-frame MJPEG encode cheap
+        quality = int(os.getenv('STREAM_JPEG_QUALITY', '70'))
+        self.jpeg_params = [cv2.IMWRITE_JPEG_QUALITY, quality, cv2.IMWRITE_JPEG_OPTIMIZE, 0, cv2.IMWRITE_JPEG_PROGRESSIVE, 0]
+        # Streamed frames wider than this are downscaled before encoding (0 = stream at camera resolution)
+        self.stream_max_width = int(os.getenv('STREAM_MAX_WIDTH', '1280'))
+        self.frame_count = 0
+        # Camera frames the loop never processed because inference was still busy with an older one
+        self.frames_skipped = 0
         self.last_pushed_gesture = None
-        self.last_push_time = 0
-        self.push_cooldown_ms = 300
+        self.push_cooldown_s = 0.3
+        self.next_push_deadline = 0.0  # time.monotonic() deadline; immune to wall-clock jumps
         
         # Face detection service
         self.face_service = FaceDetectionService()
+        # Face inference runs here while the tracking thread runs the hand model
+        # (MediaPipe releases the GIL during inference, so the two overlap)
+        self.face_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='face-detection')
 
     def start_tracking(self):
         if self.is_tracking:
             return {"status": "already_running"}
         
         # Auto-enable face detection when tracking starts
-        if self.face_service.landmarker:
+        if self.face_service.available:
             self.face_service.enable()
         
         self.is_tracking = True
@@ -319,289 +417,258 @@ class GestureRecognitionService:
 
     def _track_gestures(self):
         """Main tracking loop - simplified."""
+        camera = None
         try:
-            camera_index = int(os.getenv('CAMERA_INDEX', '0'))
-            self.camera = cv2.VideoCapture(camera_index)
+            camera = self.camera = CameraStream(**self.camera_settings)
+            camera_index = camera.camera_index
             
-            if not self.camera.isOpened():
-                print(f"Camera not available at index {camera_index}")
+            if not camera.open():
+                logger.warning(f"Camera not available at index {camera_index}")
                 self.camera_error = f"Camera could not be opened at index {camera_index}. Check permissions or if another app is using it."
                 return
             
-            # Get camera resolution
-            width = int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            print(f"Camera opened: {width}x{height}")
-            
-            # Reduce buffer for lower latency
-            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            # Capture runs on its own thread; this loop only ever sees the newest frame
+            camera.start()
+            self.static_fingerprint = None
             
-            while self.is_tracking:
-                ret, frame = self.camera.read()
+            for frame, timestamp_ms, captured_at_ms, skipped in camera.frames():
+                if not self.is_tracking:
+                    break
+                # The camera keeps only its newest frame, so a slow iteration drops the ones in between
+                self.frames_skipped += skipped
                 
-                if not ret:
-                    time.sleep(0.05)
-                    continue
+                mp_image = self.inference_images.convert(frame)
+                
+                run_face = self.face_service.enabled and self.frame_count % self.face_detection_stride == 0
+                self.frame_count += 1
                 
-                # Convert BGR to RGB
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+                face_future = None
+                if run_face:
+                    face_future = self.face_executor.submit(self.face_service.detect_face, mp_image, timestamp_ms, captured_at_ms)
                 
-                timestamp_ms = int(time.time() * 1000)
+                # An unchanged scene without a hand in view can only give "no hand" again, so skip
+                # the model. While a hand is tracked the model always runs to keep its tracking state.
+                repeated_empty_frame = self.current_gesture is None and self._is_static_frame(frame)
                 
                 # Process hand gestures
-                if self.landmarker:
+                if self.landmarker and not repeated_empty_frame:
                     result = self.landmarker.detect_for_video(mp_image, timestamp_ms)
                     
                     if result.hand_landmarks and len(result.hand_landmarks) > 0:
+                        self.static_fingerprint = None
                         hand_landmarks = result.hand_landmarks[0]
-                        gesture_data = self._analyze_gesture(hand_landmarks, timestamp_ms)
+                        gesture_data = self._analyze_gesture(hand_landmarks, timestamp_ms, captured_at_ms)
                         self.current_gesture = gesture_data
                         
                         # Draw landmarks
-                        self._draw_landmarks(frame, hand_landmarks)
+                        self._draw_landmarks(frame, self.hand_points)
                         
                         # Push to backend
-                        self._push_gesture_to_backend(gesture_data, timestamp_ms)
+                        self._push_gesture_to_backend(gesture_data)
                     else:
                         self.current_gesture = None
-                        self.position_history.clear()
+                        self.swipe_history.clear()
+                        self.held_pose = None
                 
                 # Process face detection
-                if self.face_service.enabled:
-                    face_data, face_landmarks = self.face_service.detect_face(mp_image, timestamp_ms)
-                    if face_data and face_landmarks:
-                        self.face_service.draw_face_landmarks(frame, face_landmarks)
+                if face_future:
+                    face_data, face_points = face_future.result()
+                    if face_data:
+                        self.face_service.draw_face_landmarks(frame, face_points)
                         # Push face data to backend
-                        self._push_face_to_backend(face_data, timestamp_ms)
-                
-                with self.lock:
-                    self.latest_frame = frame.copy()
+                        self._push_face_to_backend(face_data)
+                elif self.face_service.enabled:
+                    # Strided frame - keep the overlay steady with the last detection
+                    self.face_service.draw_face_landmarks(frame, self.face_service.current_face_points)
                 
-                time.sleep(0.03)  # ~30 FPS
+                self._publish_frame(frame)
+            
+            if self.is_tracking:
+                self.camera_error = "Camera capture stopped unexpectedly."
         
         except Exception as e:
-            print(f"Error in tracking loop: {e}")
+            logger.error(f"Error in tracking loop: {e}")
             self.camera_error = str(e)
         
         finally:
-            if self.camera:
-                self.camera.release()
-
-    def _get_finger_states(self, landmarks) -> Dict[str, bool]:
-        """Detect which fingers are extended."""
-        # Thumb
-        thumb_tip = landmarks[4]
-        thumb_ip = landmarks[3]
-        thumb_mcp = landmarks[2]
-        thumb_extended = abs(thumb_tip.x - thumb_mcp.x) > abs(thumb_ip.x - thumb_mcp.x) * 0.5
-        
-        # Other fingers - tip above PIP joint means extended
-        index_extended = landmarks[8].y < landmarks[6].y
-        middle_extended = landmarks[12].y < landmarks[10].y
-        ring_extended = landmarks[16].y < landmarks[14].y
-        pinky_extended = landmarks[20].y < landmarks[18].y
-        
-        return {
-            'thumb': thumb_extended,
-            'index': index_extended,
-            'middle': middle_extended,
-            'ring': ring_extended,
-            'pinky': pinky_extended
-        }
-
-    def _analyze_gesture(self, landmarks, timestamp_ms: int) -> Dict:
+            if camera:
+                camera.release()
+
+    def _is_static_frame(self, frame) -> bool:
+        """True if frame barely differs from the last frame the hand model saw, judged on every 16th pixel of one channel."""
+        fingerprint = frame[::16, ::16, 1].astype(np.int16)
+        last = self.static_fingerprint
+        if last is not None and last.shape == fingerprint.shape:
+            if float(np.abs(fingerprint - last).mean()) < self.static_frame_threshold:
+                return True
+        # Only frames the model runs on become the reference, so slow drift still adds up to a change
+        self.static_fingerprint = fingerprint
+        return False
+
+    def _analyze_gesture(self, landmarks, timestamp_ms: int, captured_at_ms: int) -> Dict:
         """Analyze hand landmarks - simplified 10 gesture detection."""
-        wrist = landmarks[0]
-        thumb_tip = landmarks[4]
-        index_tip = landmarks[8]
+        points = landmarks_to_array(landmarks, self.hand_points)
+        wrist_x, wrist_y, wrist_z = points[WRIST].tolist()
         
         # Track position for swipe detection
-        self.position_history.append({
-            'x': wrist.x,
-            'y': wrist.y,
-            'time': timestamp_ms
-        })
-        
-        # Get finger states
-        fingers = self._get_finger_states(landmarks)
-        extended_count = sum(fingers.values())
-        
-        # Calculate thumb-index distance for pinch
-        thumb_index_dist = np.sqrt(
-            (thumb_tip.x - index_tip.x)**2 + 
-            (thumb_tip.y - index_tip.y)**2
-        )
-        
-        # Detect gesture
-        gesture_type = 'unknown'
-        confidence = 0.7
+        self.swipe_history.record(wrist_x, wrist_y, timestamp_ms)
         
         # Check for swipe first (motion-based)
-        swipe = self._detect_swipe()
+        swipe = self.swipe_history.detect_swipe()
         if swipe:
-            gesture_type = swipe
-            confidence = 0.85
-        # Pinch - thumb and index close
-        elif thumb_index_dist < 0.05:
-            gesture_type = 'pinch'
-            confidence = 0.9
-        # OK sign - thumb and index form circle, others extended
-        elif thumb_index_dist < 0.06 and fingers['middle'] and fingers['ring'] and fingers['pinky']:
-            gesture_type = 'ok'
-            confidence = 0.85
-        # Fist - all fingers closed
-        elif extended_count == 0:
-            gesture_type = 'fist'
-            confidence = 0.9
-        # Open palm - all fingers extended
-        elif extended_count == 5:
-            gesture_type = 'open_palm'
-            confidence = 0.9
-        # Peace - index and middle extended
-        elif fingers['index'] and fingers['middle'] and not fingers['ring'] and not fingers['pinky']:
-            gesture_type = 'peace'
-            confidence = 0.85
-        # Thumbs up - only thumb extended, pointing up
-        elif fingers['thumb'] and extended_count == 1 and thumb_tip.y < wrist.y:
-            gesture_type = 'thumbs_up'
-            confidence = 0.85
-        # Thumbs down - only thumb extended, pointing down
-        elif fingers['thumb'] and extended_count == 1 and thumb_tip.y > wrist.y:
-            gesture_type = 'thumbs_down'
-            confidence = 0.85
-        # Point - only index extended
-        elif fingers['index'] and not fingers['middle'] and not fingers['ring'] and not fingers['pinky']:
-            gesture_type = 'point'
-            confidence = 0.85
+            gesture_type, confidence = swipe, 0.85
+            fingers = get_finger_bits(points)
+            self.held_pose = None
+        # Held pose - no landmark has moved noticeably since the last classification, so reuse it
+        elif self.held_pose is not None and np.abs(points - self.held_points).max() < 0.003:
+            gesture_type, confidence, fingers = self.held_pose
+        else:
+            fingers = get_finger_bits(points)
+            gesture_type, confidence = self._classify_pose(points, fingers)
+            self.held_pose = (gesture_type, confidence, fingers)
+            np.copyto(self.held_points, points)
         
         return {
             'type': gesture_type,
             'position': {
-                'x': float(wrist.x * 2 - 1),  # Normalize to -1 to 1
-                'y': float(1 - wrist.y * 2),
-                'z': float(wrist.z) if hasattr(wrist, 'z') else 0
+                'x': wrist_x * 2 - 1,  # Normalize to -1 to 1
+                'y': 1 - wrist_y * 2,
+                'z': wrist_z
             },
             'confidence': confidence,
-            'timestamp': timestamp_ms,
-            'fingers': fingers
+            'timestamp': captured_at_ms,
+            'fingers': {name: bool(fingers & bit) for name, bit in FINGER_BITS}
         }
 
-    def _detect_swipe(self) -> Optional[str]:
-        """Simple swipe detection based on position history."""
-        if len(self.position_history) < 8:
-            return None
-        
-        history = list(self.position_history)
+    def _classify_pose(self, points: np.ndarray, fingers: int) -> Tuple[str, float]:
+        """Classify a static hand pose. Returns (gesture type, confidence)."""
+        wrist_y = float(points[WRIST, 1])
+        thumb_tip_x, thumb_tip_y, _ = points[THUMB_TIP].tolist()
+        index_tip_x, index_tip_y, _ = points[INDEX_TIP].tolist()
         
-        # Get start and end positions
-        start = history[0]
-        end = history[-1]
+        # Squared thumb-index distance for pinch - only compared against thresholds, so no sqrt
+        pinch_dx = thumb_tip_x - index_tip_x
+        pinch_dy = thumb_tip_y - index_tip_y
+        thumb_index_dist_sq = pinch_dx * pinch_dx + pinch_dy * pinch_dy
         
-        # Calculate movement
-        dx = end['x'] - start['x']
-        dy = end['y'] - start['y']
-        dt = (end['time'] - start['time']) / 1000.0  # seconds
-        
-        if dt < 0.1:  # Too fast, likely noise
-            return None
-        
-        # Calculate velocity
-        velocity = np.sqrt(dx**2 + dy**2) / dt
+        # Pinch - thumb and index close
+        if thumb_index_dist_sq < 0.0025:  # 0.05 squared
+            return 'pinch', 0.9
+        # OK sign - thumb and index form circle, others extended
+        if thumb_index_dist_sq < 0.0036 and (fingers & (MIDDLE | RING | PINKY)) == MIDDLE | RING | PINKY:
+            return 'ok', 0.85
+        # Thumbs up/down - only thumb extended, pointing up or down
+        if fingers == THUMB:
+            if thumb_tip_y < wrist_y:
+                return 'thumbs_up', 0.85
+            if thumb_tip_y > wrist_y:
+                return 'thumbs_down', 0.85
+        # Fist, open palm, peace and point depend only on which fingers are extended
+        return STATIC_GESTURES[fingers]
+
+    def _draw_landmarks(self, frame, points: np.ndarray):
+        """Draw hand landmarks on frame from the (21, 3) normalized landmark array."""
+        h, w, _ = frame.shape
+        pixels = (points[:, :2] * np.array([w, h], dtype=np.float32)).astype(np.int32)
         
-        # Need significant movement and velocity
-        if velocity < 0.3:
-            return None
+        # Draw points
+        draw_dots(frame, pixels, 4, (0, 255, 0))
         
-        # Determine direction
-        if abs(dx) > abs(dy) * 1.5:  # Horizontal swipe
-            if dx > 0.1:
-                return 'swipe_right'
-            elif dx < -0.1:
-                return 'swipe_left'
+        # Draw connections - the whole skeleton in a single polylines call
+        cv2.polylines(frame, [pixels[strip] for strip in HAND_STRIPS], False, (0, 255, 0), 2)
+
+    def _push_gesture_to_backend(self, gesture_data: Dict):
+        """Queue gesture for the backend (sent by the pusher thread)."""
+        gesture_changed = (
+            self.last_pushed_gesture is None or
+            self.last_pushed_gesture.get('type') != gesture_data.get('type')
+        )
+        now = time.monotonic()
+        cooldown_expired = now >= self.next_push_deadline
         
-        return None
+        if gesture_changed or cooldown_expired:
+            self.backend.push('/api/gestures/process', gesture_data)
+            self.last_pushed_gesture = gesture_data
+            self.next_push_deadline = now + self.push_cooldown_s
 
-    def _draw_landmarks(self, frame, landmarks):
-        """Draw landmarks on frame."""
-        h, w, _ = frame.shape
+    def _push_face_to_backend(self, face_data: Dict):
+        """Queue face detection data for the backend (sent by the pusher thread)."""
+        # Use same cooldown mechanism as gestures to prevent spam
+        now = time.monotonic()
+        cooldown_expired = now >= self.next_push_deadline
         
-        # Draw points
-        for landmark in landmarks:
-            cx, cy = int(landmark.x * w), int(landmark.y * h)
-            cv2.circle(frame, (cx, cy), 4, (0, 255, 0), -1)
-        
-        # Draw connections
-        connections = [
-            (0, 1), (1, 2), (2, 3), (3, 4),  # Thumb
-            (0, 5), (5, 6), (6, 7), (7, 8),  # Index
-            (5, 9), (9, 10), (10, 11), (11, 12),  # Middle
-            (9, 13), (13, 14), (14, 15), (15, 16),  # Ring
-            (13, 17), (17, 18), (18, 19), (19, 20), (0, 17)  # Pinky
-        ]
-        
-        for p1, p2 in connections:
-            pt1 = (int(landmarks[p1].x * w), int(landmarks[p1].y * h))
-            pt2 = (int(landmarks[p2].x * w), int(landmarks[p2].y * h))
-            cv2.line(frame, pt1, pt2, (0, 255, 0), 2)
-
-    def _push_gesture_to_backend(self, gesture_data: Dict, timestamp_ms: int):
-        """Push gesture to backend."""
-        try:
-            gesture_changed = (
-                self.last_pushed_gesture is None or
-                self.last_pushed_gesture.get('type') != gesture_data.get('type')
-            )
-            cooldown_expired = (timestamp_ms - self.last_push_time) >= self.push_cooldown_ms
-            
-            if gesture_changed or cooldown_expired:
-                try:
-                    requests.post(
-                        f"{self.backend_url}/api/gestures/process",
-                        json=gesture_data,
-                        timeout=0.5
-                    )
-                    self.last_pushed_gesture = gesture_data.copy()
-                    self.last_push_time = timestamp_ms
-                except requests.exceptions.RequestException:
-                    pass  # Silently fail - backend might be down
-        except Exception:
-            pass
-
-    def _push_face_to_backend(self, face_data: Dict, timestamp_ms: int):
-        """Push face detection data to backend."""
-        try:
-            # Use same cooldown mechanism as gestures to prevent spam
-            cooldown_expired = (timestamp_ms - self.last_push_time) >= self.push_cooldown_ms
-            
-            if cooldown_expired and face_data:
-                try:
-                    requests.post(
-                        f"{self.backend_url}/api/faces/process",
-                        json=face_data,
-                        timeout=0.5
-                    )
-                    self.last_push_time = timestamp_ms
-                except requests.exceptions.RequestException:
-                    pass  # Silently fail - backend might be down
-        except Exception:
-            pass
+        if cooldown_expired and face_data:
+            self.backend.push('/api/faces/process', face_data)
+            self.next_push_deadline = now + self.push_cooldown_s
 
     def get_current_gesture(self) -> Optional[Dict]:
         return self.current_gesture
 
+    def _encode_jpeg(self, frame) -> Optional[bytes]:
+        """JPEG-encode a frame for the MJPEG stream, downscaling it to stream_max_width first."""
+        h, w, _ = frame.shape
+        if 0 < self.stream_max_width < w:
+            # Called from request threads as well, so the scaled frame gets its own array
+            frame = cv2.resize(frame, (self.stream_max_width, round(h * self.stream_max_width / w)), interpolation=cv2.INTER_AREA)
+        ret, encoded = cv2.imencode('.jpg', frame, self.jpeg_params)
+        return encoded.tobytes() if ret else None
+
+    def _publish_frame(self, frame):
+        """Publish the annotated frame, encoding it once and waking MJPEG viewers if any are connected."""
+        jpeg = self._encode_jpeg(frame) if self.viewers > 0 else None
+        
+        with self.frame_ready:
+            self.latest_frame = frame
+            self.latest_jpeg = jpeg
+            self.frame_version += 1
+            self.frame_ready.notify_all()
+
+    def add_viewer(self):
+        with self.lock:
+            self.viewers += 1
+
+    def remove_viewer(self):
+        with self.lock:
+            self.viewers -= 1
+
     def get_video_frame(self):
-        """Get latest frame for MJPEG stream."""
+        """Get latest JPEG frame, encoding it on demand when nobody is streaming."""
         with self.lock:
-            if self.latest_frame is None:
-                return None
-            
-            ret, jpeg = cv2.imencode('.jpg', self.latest_frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-            return jpeg.tobytes() if ret else None
+            frame, jpeg = self.latest_frame, self.latest_jpeg
+        if jpeg is not None or frame is None:
+            return jpeg
+        
+        jpeg = self._encode_jpeg(frame)
+        if jpeg is None:
+            return None
+        with self.lock:
+            if self.latest_frame is frame:
+                self.latest_jpeg = jpeg
+        return jpeg
+
+    def wait_for_video_frame(self, last_version: int, timeout: float = 1.0):
+        """Wait for a frame newer than last_version. Returns (version, jpeg); version is unchanged on timeout."""
+        with self.frame_ready:
+            self.frame_ready.wait_for(lambda: self.frame_version != last_version, timeout)
+            return self.frame_version, self.latest_jpeg
 
 
 # Initialize services
-unified_tracking_service = UnifiedTrackingService()
+# Unified tracking loads three models, so it is created on first use of a /tracking route
+_unified_tracking_service = None
+_unified_tracking_lock = threading.Lock()
+
+
+def get_unified_tracking_service() -> UnifiedTrackingService:
+    """Get the unified tracking service, creating it on first use."""
+    global _unified_tracking_service
+    if _unified_tracking_service is None:
+        with _unified_tracking_lock:
+            if _unified_tracking_service is None:
+                _unified_tracking_service = UnifiedTrackingService()
+    return _unified_tracking_service
+
+
 # Keep old services for backward compatibility during migration
 gesture_service = GestureRecognitionService()
 face_service = gesture_service.face_service
@@ -640,16 +707,17 @@ def get_status():
         'service': 'Dixi Vision Service',
         'version': '2.1.0',
         'mode': 'simplified',
-        'gestures': ['pinch', 'point', 'open_palm', 'fist', 'swipe_left', 'swipe_right', 
-                     'peace', 'thumbs_up', 'thumbs_down', 'ok'],
+        'gestures': SUPPORTED_GESTURES,
         'tracking': gesture_service.is_tracking,
         'mediapipe': 'ready' if gesture_service.landmarker else 'model_not_found',
         'face_detection': {
             'enabled': face_service.enabled,
-            'available': face_service.landmarker is not None,
+            'available': face_service.available,
             'model_loaded': face_service.landmarker is not None
         },
         'camera_error': gesture_service.camera_error,
+        'frames_processed': gesture_service.frame_count,
+        'frames_skipped': gesture_service.frames_skipped,
         'timestamp': int(time.time() * 1000)
     })
 
@@ -662,18 +730,41 @@ def dashboard():
 @app.route('/video_feed')
 def video_feed():
     def generate():
-        while True:
-            frame = gesture_service.get_video_frame()
-            if frame:
-                yield (b'--frame\r\n'
-                       b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n\r\n')
-            time.sleep(0.04)  # ~25 FPS
+        version = 0
+        # Frames are only encoded while at least one stream is open
+        gesture_service.add_viewer()
+        try:
+            while True:
+                # Block until the tracking thread publishes a new frame instead of polling
+                new_version, frame = gesture_service.wait_for_video_frame(version)
+                if new_version == version:
+                    continue
+                version = new_version
+                if not frame:
+                    continue  # Published before this viewer registered - wait for the next one
+                # Yield the JPEG as its own chunk so it is written to the socket without being copied
+                yield MJPEG_PART_HEADER
+                yield frame
+                yield MJPEG_PART_TRAILER
+        finally:
+            gesture_service.remove_viewer()
     return Response(generate(), mimetype='multipart/x-mixed-replace; boundary=frame')
 
 
 @app.route('/logs')
 def get_logs():
-    return jsonify(list(log_buffer))
+    """Recent log lines, optionally only those at or above ?level= (a name like WARNING or a number like 30)."""
+    level_arg = request.args.get('level', 'NOTSET')
+    min_level = int(level_arg) if level_arg.isdigit() else logging.getLevelName(level_arg.upper())
+    if not isinstance(min_level, int):
+        return jsonify({'error': 'Unknown log level'}), 400
+    
+    return jsonify([
+        f"[{time.strftime('%H:%M:%S', time.localtime(logged_at))}] "
+        f"{'' if level <= logging.INFO else logging.getLevelName(level) + ': '}{line}"
+        for logged_at, level, line in list(log_buffer)
+        if level >= min_level
+    ])
 
 
 @app.route('/capture_frame', methods=['GET'])
@@ -706,8 +797,10 @@ def capture_frame_base64():
 @app.route('/face', methods=['GET'])
 def get_face():
     """Get current face detection data."""
-    face_data = face_service.get_current_face()
-    return jsonify(face_data if face_data else {'detected': False, 'message': 'No face detected'})
+    face_json = face_service.get_current_face_json()
+    if face_json is None:
+        return jsonify({'detected': False, 'message': 'No face detected'})
+    return Response(face_json, mimetype='application/json')
 
 
 @app.route('/face/start', methods=['POST'])
@@ -717,7 +810,7 @@ def start_face_detection():
     return jsonify({
         'status': 'started',
         'message': 'Face detection enabled',
-        'available': face_service.landmarker is not None
+        'available': face_service.available
     })
 
 
@@ -736,7 +829,7 @@ def get_face_status():
     """Get face detection status."""
     return jsonify({
         'enabled': face_service.enabled,
-        'available': face_service.landmarker is not None,
+        'available': face_service.available,
         'current_face': face_service.get_current_face() is not None,
         'model_loaded': face_service.landmarker is not None
     })
@@ -746,41 +839,52 @@ def get_face_status():
 @app.route('/tracking', methods=['GET'])
 def get_tracking():
     """Get unified tracking data (face, hands, body, eyes)."""
-    tracking_data = unified_tracking_service.get_current_tracking()
-    return jsonify(tracking_data if tracking_data else {
-        'face': None,
-        'hands': {'left': None, 'right': None},
-        'body': None,
-        'eyes': None,
-        'timestamp': int(time.time() * 1000)
-    })
+    # Nothing can have been tracked before the service exists, so don't load models just to report that
+    service = _unified_tracking_service
+    tracking_json = service.get_current_tracking_json() if service else None
+    if tracking_json is None:
+        return jsonify({
+            'face': None,
+            'hands': {'left': None, 'right': None},
+            'body': None,
+            'eyes': None,
+            'timestamp': int(time.time() * 1000)
+        })
+    
+    # Pollers that send If-None-Match get a bodiless 304 until the tracking data changes
+    body, etag = tracking_json
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 
 @app.route('/tracking/start', methods=['POST'])
 def start_unified_tracking():
     """Start unified tracking."""
-    return jsonify(unified_tracking_service.start_tracking())
+    return jsonify(get_unified_tracking_service().start_tracking())
 
 
 @app.route('/tracking/stop', methods=['POST'])
 def stop_unified_tracking():
     """Stop unified tracking."""
-    return jsonify(unified_tracking_service.stop_tracking())
+    return jsonify(get_unified_tracking_service().stop_tracking())
 
 
 @app.route('/tracking/status', methods=['GET'])
 def get_tracking_status():
     """Get unified tracking status."""
+    service = get_unified_tracking_service()
     return jsonify({
-        'hand_tracking': unified_tracking_service.hand_landmarker is not None,
-        'face_tracking': unified_tracking_service.face_landmarker is not None,
-        'pose_tracking': unified_tracking_service.pose_landmarker is not None,
+        'hand_tracking': service.hand_landmarker is not None,
+        'face_tracking': service.face_landmarker is not None,
+        'pose_tracking': service.pose_landmarker is not None,
         'dual_hands': True,
-        'current_data': unified_tracking_service.get_current_tracking() is not None
+        'current_data': service.get_current_tracking() is not None,
+        'frames_skipped': service.frames_skipped
     })
 
 
 if __name__ == '__main__':
     port = int(os.getenv('VISION_SERVICE_PORT', 5001))
-    print(f"Dixi Vision Service starting on port {port}...")
+    logger.info(f"Dixi Vision Service starting on port {port}...")
     app.run(host='0.0.0.0', port=port, debug=False)
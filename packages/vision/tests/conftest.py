@@ -0,0 +1,10 @@
+import pytest
+
+from main import app
+
+@pytest.fixture
+def client():
+    """Create a test client for the Flask app."""
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
@@ -0,0 +1,37 @@
+import json
+import threading
+
+from backend_pusher import BackendPusher
+
+
+def test_only_newest_pending_payload_is_sent():
+    pusher = BackendPusher('http://backend')
+    posted = []
+    first_post_started = threading.Event()
+    release_first_post = threading.Event()
+    all_posted = threading.Event()
+    
+    def post(url, data, headers, timeout):
+        posted.append((url, json.loads(data)))
+        if len(posted) == 1:
+            # Hold the worker inside its first post while more payloads are queued
+            first_post_started.set()
+            release_first_post.wait(2)
+        if len(posted) == 3:
+            all_posted.set()
+    
+    pusher.session.post = post
+    
+    pusher.push('/api/gesture', {'n': 1})
+    assert first_post_started.wait(2)
+    for n in (2, 3, 4):
+        pusher.push('/api/gesture', {'n': n})
+    pusher.push('/api/face', {'n': 1})
+    release_first_post.set()
+    
+    assert all_posted.wait(2)
+    assert posted == [
+        ('http://backend/api/gesture', {'n': 1}),
+        ('http://backend/api/gesture', {'n': 4}),
+        ('http://backend/api/face', {'n': 1}),
+    ]
@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+import camera_stream
+from camera_stream import CameraStream
+
+
+def fake_frames(stream, frame_ids):
+    """Serve the given frame ids from read(), then stop the stream."""
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    pending = list(frame_ids)
+    
+    def read(last_id=0, timeout=1.0):
+        if not pending:
+            stream.is_running = False
+            return last_id, None
+        return pending.pop(0), frame
+    
+    stream.read = read
+    stream.is_running = True
+
+
+def test_frames_counts_skipped_frames():
+    stream = CameraStream(0)
+    fake_frames(stream, [1, 2, 5, 6])
+    
+    assert [skipped for _, _, _, skipped in stream.frames()] == [0, 0, 2, 0]
+
+
+def test_frame_timestamps_ignore_wall_clock_steps(monkeypatch):
+    """Inference timestamps follow the monotonic clock even when the wall clock jumps back."""
+    monotonic_ns = iter([5_000_000_000, 5_000_000_000, 5_200_000_000])
+    wall_s = iter([1000.0, 400.0, 400.2])
+    clock = SimpleNamespace(monotonic_ns=lambda: next(monotonic_ns), time=lambda: next(wall_s))
+    monkeypatch.setattr(camera_stream, 'time', clock)
+    stream = CameraStream(0)
+    fake_frames(stream, [1, 2, 3])
+    
+    stamps = [(timestamp_ms, captured_at_ms) for _, timestamp_ms, captured_at_ms, _ in stream.frames()]
+    # Repeated milliseconds are bumped so MediaPipe always sees increasing timestamps
+    assert [timestamp_ms for timestamp_ms, _ in stamps] == [5000, 5001, 5200]
+    assert [captured_at_ms for _, captured_at_ms in stamps] == [1000000, 400000, 400200]
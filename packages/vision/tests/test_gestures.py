@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from hand_landmarks import THUMB, INDEX, MIDDLE, RING, PINKY, get_finger_bits
+from main import STATIC_GESTURES, gesture_service
+
+
+def make_hand(fingers, thumb_tip_y=0.5, wrist_y=0.9):
+    """(21, 3) landmark array with the fingers in the bitmask extended and the rest curled."""
+    points = np.zeros((21, 3), dtype=np.float32)
+    points[0] = (0.5, wrist_y, 0.0)
+    # Thumb: MCP, IP, tip along x - extended when the tip reaches well past the IP joint
+    points[2] = (0.40, 0.5, 0.0)
+    points[3] = (0.35, 0.5, 0.0)
+    points[4] = (0.30 if fingers & THUMB else 0.41, thumb_tip_y, 0.0)
+    # Index..pinky: PIP at y=0.5, tip above it (smaller y) when extended, far from the thumb tip
+    for tip, pip, bit in ((8, 6, INDEX), (12, 10, MIDDLE), (16, 14, RING), (20, 18, PINKY)):
+        points[pip] = (0.7, 0.5, 0.0)
+        points[tip] = (0.7, 0.4 if fingers & bit else 0.6, 0.0)
+    return points
+
+
+@pytest.mark.parametrize('fingers', range(32))
+def test_get_finger_bits(fingers):
+    assert get_finger_bits(make_hand(fingers)) == fingers
+
+
+@pytest.mark.parametrize('fingers, expected', [
+    (0, ('fist', 0.9)),
+    (THUMB | INDEX | MIDDLE | RING | PINKY, ('open_palm', 0.9)),
+    (INDEX | MIDDLE, ('peace', 0.85)),
+    (THUMB | INDEX | MIDDLE, ('peace', 0.85)),
+    (INDEX, ('point', 0.85)),
+    (THUMB | INDEX, ('point', 0.85)),
+    (THUMB, ('unknown', 0.7)),
+    (INDEX | MIDDLE | RING, ('unknown', 0.7)),
+])
+def test_static_gestures(fingers, expected):
+    assert STATIC_GESTURES[fingers] == expected
+
+
+@pytest.mark.parametrize('thumb_tip_y, wrist_y, expected', [
+    (0.3, 0.9, ('thumbs_up', 0.85)),
+    (0.5, 0.2, ('thumbs_down', 0.85)),
+    (0.5, 0.5, ('unknown', 0.7)),
+])
+def test_classify_thumb_only(thumb_tip_y, wrist_y, expected):
+    points = make_hand(THUMB, thumb_tip_y=thumb_tip_y, wrist_y=wrist_y)
+    assert gesture_service._classify_pose(points, get_finger_bits(points)) == expected
+
+
+@pytest.mark.parametrize('fingers, expected', [
+    (0, 'fist'),
+    (THUMB | INDEX | MIDDLE | RING | PINKY, 'open_palm'),
+    (INDEX | MIDDLE, 'peace'),
+    (INDEX, 'point'),
+])
+def test_classify_pose_uses_table(fingers, expected):
+    points = make_hand(fingers)
+    assert gesture_service._classify_pose(points, get_finger_bits(points))[0] == expected
+
+
+def test_static_frame_ignores_sensor_noise(monkeypatch):
+    monkeypatch.setattr(gesture_service, 'static_fingerprint', None)
+    rng = np.random.default_rng(0)
+    scene = rng.integers(40, 200, size=(480, 640, 3), dtype=np.uint8)
+    
+    def noisy(frame):
+        noise = rng.integers(-2, 3, size=frame.shape)
+        return np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    
+    # The first frame has nothing to compare with; later noisy copies of the same scene are static
+    assert not gesture_service._is_static_frame(noisy(scene))
+    assert all(gesture_service._is_static_frame(noisy(scene)) for _ in range(10))
+
+
+def test_static_frame_detects_changes(monkeypatch):
+    monkeypatch.setattr(gesture_service, 'static_fingerprint', None)
+    scene = np.full((480, 640, 3), 100, dtype=np.uint8)
+    assert not gesture_service._is_static_frame(scene)
+    
+    # A hand-sized bright region entering the view is a change
+    moved = scene.copy()
+    moved[100:300, 200:400] = 220
+    assert not gesture_service._is_static_frame(moved)
+    
+    # Small steps that each stay under the threshold still add up against the last inferred frame
+    drifting = [moved + step for step in (1, 2)]
+    assert [gesture_service._is_static_frame(frame) for frame in drifting] == [True, False]
@@ -0,0 +1,31 @@
+import main
+
+
+def test_logs_filter_by_level_name(client):
+    main.logger.info("logs-test info line")
+    main.logger.warning("logs-test warning line")
+    
+    lines = client.get('/logs?level=warning').get_json()
+    assert any(line.endswith("WARNING: logs-test warning line") for line in lines)
+    assert not any("logs-test info line" in line for line in lines)
+    
+    lines = client.get('/logs').get_json()
+    assert any(line.endswith("] logs-test info line") for line in lines)
+
+
+def test_logs_filter_by_level_number(client):
+    main.logger.info("logs-test numeric info")
+    main.logger.error("logs-test numeric error")
+    
+    response = client.get('/logs?level=30')
+    assert response.status_code == 200
+    lines = response.get_json()
+    assert any(line.endswith("ERROR: logs-test numeric error") for line in lines)
+    assert not any("logs-test numeric info" in line for line in lines)
+
+
+def test_logs_unknown_level(client):
+    response = client.get('/logs?level=bogus')
+    
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Unknown log level'}
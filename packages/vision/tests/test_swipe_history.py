@@ -0,0 +1,116 @@
+import collections
+
+import numpy as np
+import pytest
+
+from hand_landmarks import SwipeHistory
+
+
+def deque_swipe(history):
+    """The swipe check as it ran on the original deque of {'x', 'y', 'time'} positions."""
+    if len(history) < 8:
+        return None
+    start, end = history[0], history[-1]
+    dx = end['x'] - start['x']
+    dy = end['y'] - start['y']
+    dt = (end['time'] - start['time']) / 1000.0
+    if dt < 0.1:
+        return None
+    if np.sqrt(dx**2 + dy**2) / dt < 0.3:
+        return None
+    if abs(dx) > abs(dy) * 1.5:
+        if dx > 0.1:
+            return 'swipe_right'
+        elif dx < -0.1:
+            return 'swipe_left'
+    return None
+
+
+def record_all(swipes, positions):
+    for x, y, t in positions:
+        swipes.record(x, y, t)
+
+
+def test_needs_eight_positions():
+    swipes = SwipeHistory()
+    record_all(swipes, [(0.1 + 0.1 * i, 0.5, 100 * i) for i in range(7)])
+    assert swipes.detect_swipe() is None
+    
+    swipes.record(0.9, 0.5, 700)
+    assert swipes.detect_swipe() == 'swipe_right'
+
+
+def test_wraparound_uses_oldest_and_newest_kept():
+    swipes = SwipeHistory(size=15)
+    # 20 positions: the first five are overwritten, so motion is measured from position 5 to 19
+    record_all(swipes, [(0.05 * i, 0.5, 50 * i) for i in range(20)])
+    
+    assert swipes.length == 15
+    start = (swipes.head - swipes.length) % 15
+    end = (swipes.head - 1) % 15
+    assert swipes.x[start] == pytest.approx(0.25)
+    assert swipes.t[start] == 250
+    assert swipes.x[end] == pytest.approx(0.95)
+    assert swipes.t[end] == 950
+    assert swipes.detect_swipe() == 'swipe_right'
+
+
+def test_directions_and_thresholds():
+    swipes = SwipeHistory()
+    record_all(swipes, [(0.8 - 0.05 * i, 0.5, 50 * i) for i in range(10)])
+    assert swipes.detect_swipe() == 'swipe_left'
+    
+    # Too vertical to count as a horizontal swipe
+    swipes.clear()
+    record_all(swipes, [(0.5 + 0.02 * i, 0.2 + 0.05 * i, 50 * i) for i in range(10)])
+    assert swipes.detect_swipe() is None
+    
+    # Horizontal but under 0.1 of travel
+    swipes.clear()
+    record_all(swipes, [(0.5 + 0.01 * i, 0.5, 20 * i) for i in range(10)])
+    assert swipes.detect_swipe() is None
+    
+    # Far enough, but too slow (0.2 over 2 s is under 0.3/s)
+    swipes.clear()
+    record_all(swipes, [(0.4 + 0.2 * i / 9, 0.5, 2000 * i // 9) for i in range(10)])
+    assert swipes.detect_swipe() is None
+
+
+def test_window_under_100ms_is_ignored():
+    swipes = SwipeHistory()
+    record_all(swipes, [(0.1 * i, 0.5, 10 * i) for i in range(10)])  # 90 ms end to end
+    assert swipes.detect_swipe() is None
+    
+    swipes.record(1.0, 0.5, 110)  # Window now spans 100 ms
+    assert swipes.detect_swipe() == 'swipe_right'
+
+
+def test_clear_forgets_positions():
+    swipes = SwipeHistory()
+    record_all(swipes, [(0.1 * i, 0.5, 50 * i) for i in range(10)])
+    swipes.clear()
+    assert swipes.detect_swipe() is None
+
+
+def test_matches_deque_behavior():
+    rng = np.random.default_rng(1)
+    swipes = SwipeHistory(size=15)
+    history = collections.deque(maxlen=15)
+    t = 0
+    results = collections.Counter()
+    for step in range(5000):
+        if step % 40 == 0:
+            swipes.clear()
+            history.clear()
+        # float32 values, since the ring buffer stores float32
+        x, y = np.float32(rng.uniform(0, 1, 2)).tolist()
+        t += int(rng.integers(5, 60))
+        swipes.record(x, y, t)
+        history.append({'x': x, 'y': y, 'time': t})
+        
+        expected = deque_swipe(history)
+        assert swipes.detect_swipe() == expected
+        results[expected] += 1
+    
+    # The sequence exercises both directions and the no-swipe path
+    assert results['swipe_left'] and results['swipe_right'] and results[None]
@@ -0,0 +1,56 @@
+import pytest
+
+import main
+from unified_tracking import UnifiedTrackingService
+
+
+@pytest.fixture
+def tracking_service(monkeypatch):
+    """Install a fresh unified tracking service (not started) as the app's service."""
+    service = UnifiedTrackingService()
+    monkeypatch.setattr(main, '_unified_tracking_service', service)
+    return service
+
+
+def test_tracking_empty_without_service(client, monkeypatch):
+    """Before unified tracking is used, /tracking answers without creating the service."""
+    monkeypatch.setattr(main, '_unified_tracking_service', None)
+    response = client.get('/tracking')
+    
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['face'] is None
+    assert data['hands'] == {'left': None, 'right': None}
+    assert data['body'] is None
+    assert isinstance(data['timestamp'], int)
+    assert main._unified_tracking_service is None
+
+
+def test_tracking_returns_data_with_etag(client, tracking_service):
+    tracking_service.current_tracking_data = {'face': None, 'hands': {'left': None, 'right': None}, 'timestamp': 1}
+    response = client.get('/tracking')
+    
+    assert response.status_code == 200
+    assert response.is_json
+    assert response.get_json() == tracking_service.current_tracking_data
+    assert response.headers.get('ETag')
+
+
+def test_tracking_not_modified_for_matching_etag(client, tracking_service):
+    tracking_service.current_tracking_data = {'face': None, 'timestamp': 1}
+    etag = client.get('/tracking').headers['ETag']
+    
+    response = client.get('/tracking', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+
+def test_tracking_etag_changes_with_data(client, tracking_service):
+    tracking_service.current_tracking_data = {'face': None, 'timestamp': 1}
+    etag = client.get('/tracking').headers['ETag']
+    
+    tracking_service.current_tracking_data = {'face': None, 'timestamp': 2}
+    response = client.get('/tracking', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['timestamp'] == 2
+    assert response.headers['ETag'] != etag
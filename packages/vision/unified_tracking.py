@@ -4,16 +4,28 @@ Uses MediaPipe Tasks API for efficient multi-model inference
 """
 
 import cv2
-import mediapipe as mp
-from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
 import numpy as np
+import math
 import os
 import time
+import json
+import hashlib
 import threading
+import logging
 from typing import Dict, Optional, Tuple, List
-import collections
-import requests
+from backend_pusher import BackendPusher
+from landmarkers import create_landmarker, InferenceImageConverter
+from camera_stream import CameraStream, camera_settings_from_env
+from drawing import draw_dots
+from hand_landmarks import WRIST, THUMB_TIP, INDEX_TIP, FINGER_BITS, SwipeHistory, landmarks_to_array, get_finger_bits
+
+
+logger = logging.getLogger('vision')
+
+
+# Pose landmarks drawn on the overlay: nose, eyes, left ear, shoulders, elbows, wrists, hips, knees, ankles
+POSE_KEY_POINTS = (0, 2, 5, 7, 11, 12, 13, 14, 15, 16, 23, 24, 25, 26, 27, 28)
 
 
 class UnifiedTrackingService:
@@ -29,47 +41,42 @@ class UnifiedTrackingService:
         hand_model_path = os.path.join(os.path.dirname(__file__), 'hand_landmarker.task')
         if os.path.exists(hand_model_path):
             try:
-                base_options = python.BaseOptions(model_asset_path=hand_model_path)
-                options = vision.HandLandmarkerOptions(
-                    base_options=base_options,
+                self.hand_landmarker = create_landmarker(
+                    vision.HandLandmarker, vision.HandLandmarkerOptions, hand_model_path,
                     num_hands=2,  # Dual hand tracking
                     min_hand_detection_confidence=0.7,
                     min_hand_presence_confidence=0.5,
                     min_tracking_confidence=0.5,
                     running_mode=vision.RunningMode.VIDEO
                 )
-                self.hand_landmarker = vision.HandLandmarker.create_from_options(options)
-                print("Hand Landmarker initialized (2 hands)")
+                logger.info("Hand Landmarker initialized (2 hands)")
             except Exception as e:
-                print(f"ERROR: Failed to initialize hand landmarker: {e}")
+                logger.error(f"Failed to initialize hand landmarker: {e}")
         
         # Initialize face landmarker
         face_model_path = os.path.join(os.path.dirname(__file__), 'face_landmarker.task')
         if os.path.exists(face_model_path):
             try:
-                base_options = python.BaseOptions(model_asset_path=face_model_path)
-                options = vision.FaceLandmarkerOptions(
-                    base_options=base_options,
+                self.face_landmarker = create_landmarker(
+                    vision.FaceLandmarker, vision.FaceLandmarkerOptions, face_model_path,
                     output_face_blendshapes=True,
-                    output_facial_transformation_matrixes=True,
+                    output_facial_transformation_matrixes=False,  # Head pose is estimated from landmarks
                     num_faces=1,
                     min_face_detection_confidence=0.5,
                     min_face_presence_confidence=0.5,
                     min_tracking_confidence=0.5,
                     running_mode=vision.RunningMode.VIDEO
                 )
-                self.face_landmarker = vision.FaceLandmarker.create_from_options(options)
-                print("Face Landmarker initialized")
+                logger.info("Face Landmarker initialized")
             except Exception as e:
-                print(f"ERROR: Failed to initialize face landmarker: {e}")
+                logger.error(f"Failed to initialize face landmarker: {e}")
         
         # Initialize pose landmarker
         pose_model_path = os.path.join(os.path.dirname(__file__), 'pose_landmarker.task')
         if os.path.exists(pose_model_path):
             try:
-                base_options = python.BaseOptions(model_asset_path=pose_model_path)
-                options = vision.PoseLandmarkerOptions(
-                    base_options=base_options,
+                self.pose_landmarker = create_landmarker(
+                    vision.PoseLandmarker, vision.PoseLandmarkerOptions, pose_model_path,
                     output_segmentation_masks=False,
                     num_poses=1,
                     min_pose_detection_confidence=0.5,
@@ -77,17 +84,17 @@ class UnifiedTrackingService:
                     min_tracking_confidence=0.5,
                     running_mode=vision.RunningMode.VIDEO
                 )
-                self.pose_landmarker = vision.PoseLandmarker.create_from_options(options)
-                print("Pose Landmarker initialized")
+                logger.info("Pose Landmarker initialized")
             except Exception as e:
-                print(f"ERROR: Failed to initialize pose landmarker: {e}")
+                logger.error(f"Failed to initialize pose landmarker: {e}")
         
         # Tracking state
         self.current_tracking_data = None
-        self.hand_position_history = {
-            'left': collections.deque(maxlen=15),
-            'right': collections.deque(maxlen=15)
-        }
+        self.current_tracking_json = None  # (tracking_data, JSON bytes, ETag) for the last data served
+        # Recent wrist positions for swipe detection, per hand
+        self.swipe_histories = {'left': SwipeHistory(), 'right': SwipeHistory()}
+        # Reused (21, 3) buffer of the hand being analyzed, refilled once per hand
+        self.hand_points = np.zeros((21, 3), dtype=np.float32)
         
         # Performance optimization: frame skipping
         self.frame_skip_counter = 0
@@ -105,47 +112,56 @@ class UnifiedTrackingService:
         self.tracking_thread = None
         self.latest_frame = None
         self.camera_error = None
+        # Camera frames the loop never processed because inference was still busy with an older one
+        self.frames_skipped = 0
         self.lock = threading.Lock()
         
+        # Camera settings are read once; every start() opens a new stream with them
+        self.camera_settings = camera_settings_from_env()
+        
         # Backend push settings
         self.backend_url = os.getenv('BACKEND_URL', 'http://localhost:3001')
-        self.last_push_time = 0
-        self.push_cooldown_ms = 300
+        self.backend = BackendPusher(self.backend_url)
+        self.push_cooldown_s = 0.3
+        self.next_push_deadline = 0.0  # time.monotonic()
+        
+        # Downscales and converts camera frames for the models, reusing its buffers
+        self.inference_images = InferenceImageConverter()
     
-    def process_frame(self, mp_image, timestamp_ms: int) -> Dict:
+    def process_frame(self, mp_image, timestamp_ms: int, captured_at_ms: int) -> Dict:
         """Process a single frame and return unified tracking data."""
         self.frame_skip_counter += 1
         if self.frame_skip_counter % self.frame_skip_interval != 0:
-            return self.current_tracking_data or self._empty_tracking_data(timestamp_ms)
+            return self.current_tracking_data or self._empty_tracking_data(captured_at_ms)
         
         tracking_data = {
             'face': None,
             'hands': {'left': None, 'right': None},
             'body': None,
             'eyes': None,
-            'timestamp': timestamp_ms
+            'timestamp': captured_at_ms
         }
         
         # Process face (includes eye data)
         if self.face_landmarker:
-            face_data, eye_data = self._process_face(mp_image, timestamp_ms)
+            face_data, eye_data = self._process_face(mp_image, timestamp_ms, captured_at_ms)
             tracking_data['face'] = face_data
             tracking_data['eyes'] = eye_data
         
         # Process hands (dual hand tracking)
         if self.hand_landmarker:
-            hands_data = self._process_hands(mp_image, timestamp_ms)
+            hands_data = self._process_hands(mp_image, timestamp_ms, captured_at_ms)
             tracking_data['hands'] = hands_data
         
         # Process body pose
         if self.pose_landmarker:
-            body_data = self._process_pose(mp_image, timestamp_ms)
+            body_data = self._process_pose(mp_image, timestamp_ms, captured_at_ms)
             tracking_data['body'] = body_data
         
         self.current_tracking_data = tracking_data
         return tracking_data
     
-    def _process_face(self, mp_image, timestamp_ms: int) -> Tuple[Optional[Dict], Optional[Dict]]:
+    def _process_face(self, mp_image, timestamp_ms: int, captured_at_ms: int) -> Tuple[Optional[Dict], Optional[Dict]]:
         """Process face detection and extract face + eye data."""
         try:
             result = self.face_landmarker.detect_for_video(mp_image, timestamp_ms)
@@ -273,7 +289,7 @@ class UnifiedTrackingService:
                     'eye_engagement': float(eye_engagement),
                     'is_engaged': bool(engagement_score > 0.6)
                 },
-                'timestamp': timestamp_ms
+                'timestamp': captured_at_ms
             }
             
             # Add blendshapes if available
@@ -323,10 +339,10 @@ class UnifiedTrackingService:
             return face_data, eye_data
             
         except Exception as e:
-            print(f"Face processing error: {e}")
+            logger.error(f"Face processing error: {e}")
             return None, None
     
-    def _process_hands(self, mp_image, timestamp_ms: int) -> Dict:
+    def _process_hands(self, mp_image, timestamp_ms: int, captured_at_ms: int) -> Dict:
         """Process dual hand tracking."""
         hands_data = {'left': None, 'right': None}
         
@@ -341,65 +357,57 @@ class UnifiedTrackingService:
                 if idx >= 2:  # Max 2 hands
                     break
                 
-                # Determine hand label (left/right)
-                # MediaPipe provides hand_world_landmarks for better 3D positioning
-                # Use wrist position and thumb to determine handedness
-                wrist = hand_landmarks[0]
-                thumb_tip = hand_landmarks[4]
-                index_tip = hand_landmarks[8]
+                # Read every landmark from MediaPipe once; everything below works on the array
+                points = landmarks_to_array(hand_landmarks, self.hand_points)
+                wrist_x, wrist_y = points[WRIST, :2].tolist()
                 
+                # Determine hand label (left/right)
                 # Simple handedness: if thumb is to the left of wrist, it's likely a right hand
                 # (from camera perspective, mirrored)
-                is_right_hand = thumb_tip.x < wrist.x
+                is_right_hand = points[THUMB_TIP, 0] < wrist_x
                 hand_label = 'right' if is_right_hand else 'left'
                 
                 # If we already have data for this hand, keep the one with higher confidence
                 if hands_data[hand_label] is not None:
                     # Use the hand that's more centered (better tracking)
                     current_wrist_x = abs(hands_data[hand_label]['position']['x'])
-                    new_wrist_x = abs(wrist.x * 2 - 1)
+                    new_wrist_x = abs(wrist_x * 2 - 1)
                     if new_wrist_x > current_wrist_x:
                         continue  # Keep existing hand
                 
                 # Analyze gesture
-                gesture_data = self._analyze_hand_gesture(hand_landmarks, hand_label, timestamp_ms)
+                gesture_data = self._analyze_hand_gesture(points, hand_label, captured_at_ms)
                 hands_data[hand_label] = gesture_data
                 
                 # Update position history
-                self.hand_position_history[hand_label].append({
-                    'x': wrist.x,
-                    'y': wrist.y,
-                    'time': timestamp_ms
-                })
+                self.swipe_histories[hand_label].record(wrist_x, wrist_y, timestamp_ms)
             
             return hands_data
             
         except Exception as e:
-            print(f"Hand processing error: {e}")
+            logger.error(f"Hand processing error: {e}")
             return hands_data
     
-    def _analyze_hand_gesture(self, landmarks, hand_label: str, timestamp_ms: int) -> Dict:
-        """Analyze hand landmarks to detect gesture."""
-        wrist = landmarks[0]
-        thumb_tip = landmarks[4]
-        index_tip = landmarks[8]
+    def _analyze_hand_gesture(self, points: np.ndarray, hand_label: str, captured_at_ms: int) -> Dict:
+        """Analyze the (21, 3) hand landmark array to detect gesture."""
+        landmark_rows = points.tolist()
+        wrist_x, wrist_y, wrist_z = landmark_rows[WRIST]
+        thumb_tip_x, thumb_tip_y, _ = landmark_rows[THUMB_TIP]
+        index_tip_x, index_tip_y, _ = landmark_rows[INDEX_TIP]
         
         # Get finger states
-        fingers = self._get_finger_states(landmarks)
+        fingers = self._get_finger_states(points)
         extended_count = sum(fingers.values())
         
         # Calculate thumb-index distance for pinch
-        thumb_index_dist = np.sqrt(
-            (thumb_tip.x - index_tip.x)**2 + 
-            (thumb_tip.y - index_tip.y)**2
-        )
+        thumb_index_dist = math.hypot(thumb_tip_x - index_tip_x, thumb_tip_y - index_tip_y)
         
         # Detect gesture
         gesture_type = 'unknown'
         confidence = 0.7
         
         # Check for swipe
-        swipe = self._detect_swipe(hand_label)
+        swipe = self.swipe_histories[hand_label].detect_swipe()
         if swipe:
             gesture_type = swipe
             confidence = 0.85
@@ -418,10 +426,10 @@ class UnifiedTrackingService:
         elif fingers['index'] and fingers['middle'] and not fingers['ring'] and not fingers['pinky']:
             gesture_type = 'peace'
             confidence = 0.85
-        elif fingers['thumb'] and extended_count == 1 and thumb_tip.y < wrist.y:
+        elif fingers['thumb'] and extended_count == 1 and thumb_tip_y < wrist_y:
             gesture_type = 'thumbs_up'
             confidence = 0.85
-        elif fingers['thumb'] and extended_count == 1 and thumb_tip.y > wrist.y:
+        elif fingers['thumb'] and extended_count == 1 and thumb_tip_y > wrist_y:
             gesture_type = 'thumbs_down'
             confidence = 0.85
         elif fingers['index'] and not fingers['middle'] and not fingers['ring'] and not fingers['pinky']:
@@ -430,69 +438,24 @@ class UnifiedTrackingService:
         
         return {
             'detected': True,
-            'landmarks': [{'x': float(lm.x), 'y': float(lm.y), 'z': float(lm.z) if hasattr(lm, 'z') else 0.0} 
-                         for lm in landmarks],
+            'landmarks': [{'x': x, 'y': y, 'z': z} for x, y, z in landmark_rows],
             'gesture': gesture_type,
             'position': {
-                'x': float(wrist.x * 2 - 1),  # Normalize to -1 to 1
-                'y': float(1 - wrist.y * 2),
-                'z': float(wrist.z) if hasattr(wrist, 'z') else 0
+                'x': wrist_x * 2 - 1,  # Normalize to -1 to 1
+                'y': 1 - wrist_y * 2,
+                'z': wrist_z
             },
             'confidence': confidence,
             'fingers': fingers,
-            'timestamp': timestamp_ms
+            'timestamp': captured_at_ms
         }
     
-    def _get_finger_states(self, landmarks) -> Dict[str, bool]:
-        """Detect which fingers are extended."""
-        thumb_tip = landmarks[4]
-        thumb_ip = landmarks[3]
-        thumb_mcp = landmarks[2]
-        thumb_extended = abs(thumb_tip.x - thumb_mcp.x) > abs(thumb_ip.x - thumb_mcp.x) * 0.5
-        
-        index_extended = landmarks[8].y < landmarks[6].y
-        middle_extended = landmarks[12].y < landmarks[10].y
-        ring_extended = landmarks[16].y < landmarks[14].y
-        pinky_extended = landmarks[20].y < landmarks[18].y
-        
-        return {
-            'thumb': thumb_extended,
-            'index': index_extended,
-            'middle': middle_extended,
-            'ring': ring_extended,
-            'pinky': pinky_extended
-        }
+    def _get_finger_states(self, points: np.ndarray) -> Dict[str, bool]:
+        """Detect which fingers are extended from the (21, 3) landmark array."""
+        fingers = get_finger_bits(points)
+        return {name: bool(fingers & bit) for name, bit in FINGER_BITS}
     
-    def _detect_swipe(self, hand_label: str) -> Optional[str]:
-        """Detect swipe gesture for a specific hand."""
-        history = self.hand_position_history[hand_label]
-        if len(history) < 8:
-            return None
-        
-        history_list = list(history)
-        start = history_list[0]
-        end = history_list[-1]
-        
-        dx = end['x'] - start['x']
-        dy = end['y'] - start['y']
-        dt = (end['time'] - start['time']) / 1000.0
-        
-        if dt < 0.1:
-            return None
-        
-        velocity = np.sqrt(dx**2 + dy**2) / dt
-        if velocity < 0.3:
-            return None
-        
-        if abs(dx) > abs(dy) * 1.5:
-            if dx > 0.1:
-                return 'swipe_right'
-            elif dx < -0.1:
-                return 'swipe_left'
-        
-        return None
-    
-    def _process_pose(self, mp_image, timestamp_ms: int) -> Optional[Dict]:
+    def _process_pose(self, mp_image, timestamp_ms: int, captured_at_ms: int) -> Optional[Dict]:
         """Process body pose tracking."""
         try:
             result = self.pose_landmarker.detect_for_video(mp_image, timestamp_ms)
@@ -567,27 +530,40 @@ class UnifiedTrackingService:
                     'left_hip': {'x': float(left_hip.x), 'y': float(left_hip.y)},
                     'right_hip': {'x': float(right_hip.x), 'y': float(right_hip.y)}
                 },
-                'timestamp': timestamp_ms
+                'timestamp': captured_at_ms
             }
             
         except Exception as e:
-            print(f"Pose processing error: {e}")
+            logger.error(f"Pose processing error: {e}")
             return None
     
-    def _empty_tracking_data(self, timestamp_ms: int) -> Dict:
+    def _empty_tracking_data(self, captured_at_ms: int) -> Dict:
         """Return empty tracking data structure."""
         return {
             'face': None,
             'hands': {'left': None, 'right': None},
             'body': None,
             'eyes': None,
-            'timestamp': timestamp_ms
+            'timestamp': captured_at_ms
         }
     
     def get_current_tracking(self) -> Optional[Dict]:
         """Get current tracking data."""
         return self.current_tracking_data
     
+    def get_current_tracking_json(self) -> Optional[Tuple[bytes, str]]:
+        """Get current tracking data as (JSON bytes, ETag), serialized once per tracking update."""
+        tracking_data = self.current_tracking_data
+        if tracking_data is None:
+            return None
+        
+        # Keyed on the dict itself - skipped frames hand back the same dict, so polls between updates hit
+        cached = self.current_tracking_json
+        if cached is None or cached[0] is not tracking_data:
+            body = json.dumps(tracking_data, separators=(',', ':')).encode()
+            cached = self.current_tracking_json = (tracking_data, body, hashlib.blake2b(body, digest_size=8).hexdigest())
+        return cached[1], cached[2]
+    
     def start_tracking(self):
         """Start unified tracking loop."""
         if self.is_tracking:
@@ -615,36 +591,30 @@ class UnifiedTrackingService:
     
     def _tracking_loop(self):
         """Main tracking loop that processes camera frames."""
+        camera = None
         try:
-            camera_index = int(os.getenv('CAMERA_INDEX', '0'))
-            self.camera = cv2.VideoCapture(camera_index)
+            camera = self.camera = CameraStream(**self.camera_settings)
+            camera_index = camera.camera_index
             
-            if not self.camera.isOpened():
-                print(f"Camera not available at index {camera_index}")
+            if not camera.open():
+                logger.warning(f"Camera not available at index {camera_index}")
                 self.camera_error = f"Camera could not be opened at index {camera_index}."
                 return
             
-            width = int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            print(f"Camera opened: {width}x{height}")
-            
-            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            # Capture runs on its own thread; each iteration blocks until the next frame
+            # arrives instead of sleeping, so the loop runs at the camera's own frame rate
+            camera.start()
             
-            while self.is_tracking:
-                ret, frame = self.camera.read()
-                
-                if not ret:
-                    time.sleep(0.05)
-                    continue
-                
-                # Convert BGR to RGB
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+            for frame, timestamp_ms, captured_at_ms, skipped in camera.frames():
+                if not self.is_tracking:
+                    break
+                # The camera keeps only its newest frame, so a slow iteration drops the ones in between
+                self.frames_skipped += skipped
                 
-                timestamp_ms = int(time.time() * 1000)
+                mp_image = self.inference_images.convert(frame)
                 
                 # Process unified tracking
-                tracking_data = self.process_frame(mp_image, timestamp_ms)
+                tracking_data = self.process_frame(mp_image, timestamp_ms, captured_at_ms)
                 
                 # Draw overlays on frame
                 self._draw_overlays(frame, tracking_data)
@@ -652,33 +622,34 @@ class UnifiedTrackingService:
                 # Push to backend
                 self._push_to_backend(tracking_data, timestamp_ms)
                 
+                # Each camera frame is a new array this loop never touches again,
+                # so hand over the reference instead of copying it
                 with self.lock:
-                    self.latest_frame = frame.copy()
-                
-                time.sleep(0.03)  # ~30 FPS
+                    self.latest_frame = frame
+            
+            if self.is_tracking:
+                self.camera_error = "Camera capture stopped unexpectedly."
         
         except Exception as e:
-            print(f"Error in tracking loop: {e}")
+            logger.error(f"Error in tracking loop: {e}")
             self.camera_error = str(e)
         
         finally:
-            if self.camera:
-                self.camera.release()
+            if camera:
+                camera.release()
     
     def _draw_overlays(self, frame, tracking_data: Dict):
         """Draw tracking overlays on frame."""
         h, w, _ = frame.shape
         
-        # Draw hands
+        # Draw hands - landmarks of both hands in a single call
         if tracking_data.get('hands'):
-            for hand_label in ['left', 'right']:
-                hand = tracking_data['hands'][hand_label]
-                if hand and hand.get('landmarks'):
-                    landmarks = hand['landmarks']
-                    # Draw hand landmarks
-                    for lm in landmarks:
-                        cx, cy = int(lm['x'] * w), int(lm['y'] * h)
-                        cv2.circle(frame, (cx, cy), 4, (0, 255, 0), -1)
+            hand_points = [
+                (lm['x'] * w, lm['y'] * h)
+                for hand_label in ['left', 'right']
+                for lm in (tracking_data['hands'][hand_label] or {}).get('landmarks') or ()
+            ]
+            draw_dots(frame, np.array(hand_points, dtype=np.float32).astype(np.int32), 4, (0, 255, 0))
         
         # Draw face bounding box
         if tracking_data.get('face') and tracking_data['face'].get('bounding_box'):
@@ -693,12 +664,11 @@ class UnifiedTrackingService:
         if tracking_data.get('body') and tracking_data['body'].get('landmarks'):
             landmarks = tracking_data['body']['landmarks']
             # Draw key points
-            key_indices = [0, 2, 5, 7, 11, 12, 13, 14, 15, 16, 23, 24, 25, 26, 27, 28]
-            for idx in key_indices:
-                if idx < len(landmarks):
-                    lm = landmarks[idx]
-                    cx, cy = int(lm['x'] * w), int(lm['y'] * h)
-                    cv2.circle(frame, (cx, cy), 5, (255, 0, 255), -1)
+            body_points = [
+                (landmarks[idx]['x'] * w, landmarks[idx]['y'] * h)
+                for idx in POSE_KEY_POINTS if idx < len(landmarks)
+            ]
+            draw_dots(frame, np.array(body_points, dtype=np.float32).astype(np.int32), 5, (255, 0, 255))
     
     def _push_to_backend(self, tracking_data: Dict, timestamp_ms: int):
         """Push unified tracking data to backend (with batching)."""
@@ -716,19 +686,14 @@ class UnifiedTrackingService:
                 # Use the most recent tracking data from batch
                 latest_data = self.update_batch[-1]
                 
-                cooldown_expired = (timestamp_ms - self.last_push_time) >= self.push_cooldown_ms
+                now = time.monotonic()
+                cooldown_expired = now >= self.next_push_deadline
                 
                 if cooldown_expired:
-                    try:
-                        requests.post(
-                            f"{self.backend_url}/api/tracking/process",
-                            json=latest_data,
-                            timeout=0.5
-                        )
-                        self.last_push_time = timestamp_ms
-                        self.last_batch_push = timestamp_ms
-                    except requests.exceptions.RequestException:
-                        pass  # Silently fail
+                    # Sent by the pusher thread over a kept-alive connection
+                    self.backend.push('/api/tracking/process', latest_data)
+                    self.next_push_deadline = now + self.push_cooldown_s
+                    self.last_batch_push = timestamp_ms
                 
                 # Clear batch
                 self.update_batch.clear()